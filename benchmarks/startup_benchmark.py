@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for search_releases.py
+
+Measures time-to-first-output (the first line the tool prints) and total run time for
+--help and for a report against an export, once per CSV engine.
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'search_releases.py')
+
+def time_run(command, cwd):
+    """Run a command and return (seconds to its first output line, total seconds)"""
+    start = time.perf_counter()
+    proc = subprocess.Popen(command, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    proc.stdout.readline()
+    first_output = time.perf_counter() - start
+    proc.stdout.read()
+    proc.wait()
+    return first_output, time.perf_counter() - start
+
+def benchmark(label, command, cwd, runs):
+    """Time a command several times and print the median timings"""
+    timings = [time_run(command, cwd) for _ in range(runs)]
+    first_output = statistics.median(t[0] for t in timings)
+    total = statistics.median(t[1] for t in timings)
+    print(f"{label:<24} first output {first_output * 1000:8.1f} ms   total {total * 1000:8.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure search_releases.py startup time')
+    
+    parser.add_argument('-c', '--csv-file',
+                       help='Export to run the report against (default: auto-detect in --workdir)')
+    
+    parser.add_argument('--workdir', default=os.getcwd(),
+                       help='Directory with source.txt, reference.txt and the export (default: current directory)')
+    
+    parser.add_argument('-n', '--runs', type=int, default=5,
+                       help='Runs per measurement; the median is reported (default: 5)')
+    
+    args = parser.parse_args()
+    
+    output_file = os.devnull
+    report = [sys.executable, SCRIPT, '-o', output_file, '--no-cache']
+    if args.csv_file:
+        report += ['-c', os.path.abspath(args.csv_file)]
+    
+    benchmark('--help', [sys.executable, SCRIPT, '--help'], args.workdir, args.runs)
+    for engine in ['auto', 'python', 'pandas', 'pyarrow']:
+        benchmark(f"report ({engine})", report + ['--csv-engine', engine], args.workdir, args.runs)
+
+if __name__ == "__main__":
+    main()
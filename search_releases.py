@@ -1,11 +1,199 @@
 #!/usr/bin/env python3
 
-import pandas as pd
 import os
 import re
+import csv
+import json
+import math
+import time
+import sys
+import lzma
+import sqlite3
+import hashlib
 import argparse
-from collections import OrderedDict
-from datetime import datetime, date
+import contextlib
+import heapq
+import functools
+import unicodedata
+import importlib.util
+from operator import eq, ge, gt, le, lt, ne
+from collections import OrderedDict, deque
+from datetime import datetime, date, timedelta
+
+def lazy_import(name):
+    """Import a module on first attribute access, keeping heavy dependencies off the startup path"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# pandas is only imported once a DataFrame is actually needed, so --help and
+# small exports handled by the pure-Python engine never pay for it
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+# --output value that sends the report to stdout instead of a file
+STDOUT_OUTPUT = '-'
+
+# Report formats selectable with --format, and the default output file of each
+OUTPUT_FORMATS = OrderedDict([('text', 'results.txt'), ('json', 'results.json'), ('ndjson', 'results.ndjson'),
+                              ('csv', 'results.csv'), ('parquet', 'results.parquet')])
+# Export columns of each release block in the text report, and the block they fill in
+RELEASE_BLOCK_COLUMNS = ['BU', 'Release', 'GA date', 'GA name', 'Maintainers', 'Link', 'Product']
+RELEASE_BLOCK_TEMPLATE = '\n'.join(['  BU: {}', '  Release: {}', '  GA date: {}', '  GA name: {}', '  Maintainer: {}',
+                                    '  Link: {}', '  Product: {}', '  ' + '-' * 40])
+# Fields of each release in the machine-readable formats, and the export column they come from
+RELEASE_RECORD_FIELDS = OrderedDict([('BU', 'BU'), ('Release', 'Release'), ('GA date', 'GA date'),
+                                     ('GA name', 'GA name'), ('Maintainer', 'Maintainers'), ('Link', 'Link'),
+                                     ('Product', 'Product')])
+
+# On-disk cache of parsed exports, stored next to the CSV as Arrow/Feather
+CACHE_SUFFIX = '.conan.feather'
+CACHE_FORMAT_VERSION = 2
+CACHE_METADATA_KEY = b'conan_cache'
+
+# Columns of the Product Pages export used by the tool; everything else is skipped at parse time
+EXPORT_COLUMNS = ['BU', 'Release', 'Release shortname', 'Release ID', 'GA name', 'GA date', 'Maintainers', 'Link', 'Product']
+OPTIONAL_EXPORT_COLUMNS = {'Release shortname', 'Release ID', 'Maintainers'}
+EXPORT_DTYPES = {
+    'BU': 'category',
+    'Product': 'category',
+    'Release': str,
+    'Release shortname': str,
+    'Release ID': str,
+    'GA name': str,
+    'GA date': str,
+    'Maintainers': str,
+    'Link': str,
+}
+GA_DATE_FORMAT = '%Y-%m-%d'
+
+# CSV parser backends selectable with --csv-engine; auto picks the pure-Python
+# engine for small exports and pandas otherwise
+DATAFRAME_ENGINES = ['pandas', 'pyarrow']
+CSV_ENGINES = ['auto', 'python'] + DATAFRAME_ENGINES
+SMALL_EXPORT_BYTES = 4 * 1024 * 1024
+# Strings read_csv treats as missing by default
+CSV_NA_VALUES = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+])
+# Missing cell in the pure-Python engine: a single NaN object, so it prints and compares like pandas
+MISSING = float('nan')
+
+# Columns searched for product names when no release name matches
+SEARCH_COLUMNS = ['Product', 'Release', 'Release shortname', 'Release ID', 'GA name']
+
+# Length of the substrings indexed by TrigramIndex
+TRIGRAM_SIZE = 3
+
+# Version numbers in release names, and the reference.txt version filters:
+# "4.20" (that minor, any patch), "4.20.1", ">=4.18,<4.21" or "latest 2" (newest two minors)
+VERSION_PATTERN = re.compile(r'(\d+)\.(\d+)(?:\.(\d+))?')
+VERSION_BOUND_PATTERN = re.compile(r'^(>=|<=|==|!=|>|<)?\s*(\d+)\.(\d+)(?:\.(\d+))?$')
+VERSION_COMPARISONS = {'>=': ge, '<=': le, '==': eq, '!=': ne, '>': gt, '<': lt}
+# SQLite spells every comparison the same way
+SQL_COMPARISONS = {comparison: symbol for symbol, comparison in VERSION_COMPARISONS.items()}
+# Radix of the integer sort keys built from major/minor/patch
+VERSION_KEY_BASE = 100000
+
+# Product abbreviations usable in reference.txt; entries in the aliases file add to or override these
+DEFAULT_PRODUCT_ALIASES = {
+    'OCP': 'Red Hat OpenShift Container Platform',
+    'ACM': 'Red Hat Advanced Cluster Management for Kubernetes',
+    'QUAY': 'Red Hat Quay',
+    'ODF': 'Red Hat OpenShift Data Foundation',
+}
+
+# Rows per chunk read in --stream mode
+STREAM_CHUNK_ROWS = 200000
+
+# Export discovery and --export-dir merging
+EXPORT_PREFIX = 'Product-Pages-Export'
+# Compressed exports are decompressed while parsing and preferred over a plain .csv with the same name
+COMPRESSED_EXPORT_EXTENSIONS = ['.csv.zst', '.csv.gz', '.csv.xz']
+EXPORT_EXTENSIONS = COMPRESSED_EXPORT_EXTENSIONS + ['.csv']
+EXPORT_DATE_PATTERN = re.compile(r'(\d{4})[-_]?(\d{2})[-_]?(\d{2})')
+EXPORT_ORDERS = ['name', 'mtime']
+MERGE_STATE_FILE = '.conan-merged.feather'
+
+# Per-product results and row fingerprints kept between runs by --delta
+DELTA_STATE_FILE = '.conan-delta.feather'
+NO_RELEASE_ID = ''
+
+# Release database written by the import command and queried with --backend sqlite;
+# --backend join answers every product group of the loaded export with one set of joins
+BACKENDS = ['pandas', 'join', 'sqlite']
+RELEASE_DB_FILE = 'conan.db'
+# Stored in PRAGMA user_version; bumped when the parsed versions must be rebuilt
+RELEASE_DB_VERSION = 1
+# snake_case key of each export column, used for SQL columns and release record attributes
+COLUMN_KEYS = OrderedDict((col, col.lower().replace(' ', '_')) for col in EXPORT_COLUMNS)
+SQL_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+RELEASE_DB_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS releases (
+    row_id INTEGER PRIMARY KEY,
+    bu TEXT,
+    release TEXT,
+    release_shortname TEXT,
+    release_id TEXT,
+    ga_name TEXT,
+    ga_date TEXT,
+    maintainers TEXT,
+    link TEXT,
+    product TEXT
+);
+CREATE INDEX IF NOT EXISTS releases_product ON releases (product);
+CREATE INDEX IF NOT EXISTS releases_release ON releases (release);
+CREATE INDEX IF NOT EXISTS releases_release_id ON releases (release_id);
+CREATE INDEX IF NOT EXISTS releases_ga_date ON releases (ga_date);
+CREATE TABLE IF NOT EXISTS versions (
+    row_id INTEGER PRIMARY KEY,
+    major INTEGER,
+    minor INTEGER,
+    patch INTEGER,
+    minor_key INTEGER,
+    patch_key INTEGER
+);
+CREATE INDEX IF NOT EXISTS versions_minor_key ON versions (minor_key);
+CREATE INDEX IF NOT EXISTS versions_patch_key ON versions (patch_key);
+CREATE TRIGGER IF NOT EXISTS versions_delete AFTER DELETE ON releases BEGIN
+    DELETE FROM versions WHERE row_id = old.row_id;
+END;
+CREATE TABLE IF NOT EXISTS imports (
+    import_id INTEGER PRIMARY KEY,
+    source TEXT,
+    imported_at TEXT,
+    records INTEGER
+);
+'''
+RELEASE_DB_FTS_SCHEMA = '''
+CREATE VIRTUAL TABLE IF NOT EXISTS releases_fts USING fts5 (
+    product, release, release_shortname, release_id, ga_name,
+    content='releases', content_rowid='row_id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS releases_fts_insert AFTER INSERT ON releases BEGIN
+    INSERT INTO releases_fts (rowid, product, release, release_shortname, release_id, ga_name)
+    VALUES (new.row_id, new.product, new.release, new.release_shortname, new.release_id, new.ga_name);
+END;
+CREATE TRIGGER IF NOT EXISTS releases_fts_delete AFTER DELETE ON releases BEGIN
+    INSERT INTO releases_fts (releases_fts, rowid, product, release, release_shortname, release_id, ga_name)
+    VALUES ('delete', old.row_id, old.product, old.release, old.release_shortname, old.release_id, old.ga_name);
+END;
+CREATE TABLE IF NOT EXISTS releases_non_ascii (
+    row_id INTEGER PRIMARY KEY
+);
+CREATE TRIGGER IF NOT EXISTS releases_non_ascii_delete AFTER DELETE ON releases BEGIN
+    DELETE FROM releases_non_ascii WHERE row_id = old.row_id;
+END;
+'''
 
 def parse_arguments():
     """Parse command-line arguments"""
@@ -16,9 +204,26 @@ def parse_arguments():
 Examples:
   %(prog)s                                    # Use default files
   %(prog)s -c mydata.csv -s operators.txt    # Specify custom input files
+  %(prog)s -c export.csv.zst                 # Read a compressed export (.csv.gz, .csv.xz, .csv.zst)
   %(prog)s --show-all                        # Show all releases, not just future ones
+  %(prog)s --from 2026-01-01 --to 2026-06-30 # Show releases with GA dates in a date window
+  %(prog)s --top all                         # List every matching release per product, not just the closest 2
   %(prog)s --no-version-filter               # Disable version filtering
   %(prog)s -o custom_results.txt             # Specify custom output file
+  %(prog)s -o - > results.txt                # Write the report to stdout only
+  %(prog)s --quiet                           # Write results.txt without echoing the report
+  %(prog)s --format ndjson -o -              # Stream per-product JSON records to stdout
+  %(prog)s --stream-results                  # Write each product's result as soon as it is searched
+  %(prog)s --no-cache                        # Re-parse the CSV instead of using the cache
+  %(prog)s --stream -c archive.csv           # Scan a larger-than-memory export in chunks
+  %(prog)s --csv-engine pyarrow              # Parse the CSV with the multi-threaded Arrow reader
+  %(prog)s --csv-engine python               # Parse the CSV with the csv module, without importing pandas
+  %(prog)s --export-dir exports/             # Merge every export in a directory, newest wins
+  %(prog)s --delta                           # Only re-search products whose export rows changed
+  %(prog)s import -c export.csv              # Load an export into the SQLite release database
+  %(prog)s --backend sqlite                  # Answer searches from the SQLite release database
+  %(prog)s diff old.json new.json            # Added/removed releases and GA date shifts between two snapshots
+  %(prog)s --backend join                    # Answer all product groups with one vectorized join
         '''
     )
     
@@ -26,7 +231,8 @@ Examples:
         '-c', '--csv-file',
         dest='csv_file',
         default=None,
-        help='Path to CSV file (default: auto-detect Product-Pages-Export-*.csv or first .csv file)'
+        help='Path to CSV file, optionally compressed as .csv.gz, .csv.xz or .csv.zst '
+             '(default: auto-detect the newest Product-Pages-Export-*.csv, or the newest .csv file)'
     )
     
     parser.add_argument(
@@ -43,11 +249,42 @@ Examples:
         help='Path to reference file containing version filters (default: reference.txt)'
     )
     
+    parser.add_argument(
+        '-a', '--aliases-file',
+        dest='aliases_file',
+        default='aliases.txt',
+        help='Path to the product alias table used by the reference file (default: aliases.txt, '
+             'falling back to the built-in OCP, ACM, QUAY and ODF aliases)'
+    )
+    
     parser.add_argument(
         '-o', '--output',
         dest='output_file',
-        default='results.txt',
-        help='Path to output file (default: results.txt)'
+        default=None,
+        help='Path to output file, or - to write the report to stdout only '
+             '(default: results.txt, or results.json, .ndjson, .csv or .parquet for the other formats)'
+    )
+    
+    parser.add_argument(
+        '--stream-results',
+        action='store_true',
+        help='Write each product to the text report as soon as it has been searched, in source.txt order, '
+             'with the totals in the closing summary'
+    )
+    
+    parser.add_argument(
+        '-f', '--format',
+        dest='output_format',
+        choices=list(OUTPUT_FORMATS),
+        default='text',
+        help='Report format: the text report, or per-product records as json, ndjson (one product per line, '
+             'written as each product is searched), csv or parquet (default: text)'
+    )
+    
+    parser.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='Write the report file without echoing it to the console'
     )
     
     parser.add_argument(
@@ -56,44 +293,976 @@ Examples:
         help='Show all releases, not just future ones'
     )
     
+    parser.add_argument(
+        '--from',
+        dest='date_from',
+        type=parse_date_option,
+        default=None,
+        metavar='YYYY-MM-DD',
+        help='Only show releases with a GA date on or after this date (replaces the after-today filter)'
+    )
+    
+    parser.add_argument(
+        '--to',
+        dest='date_to',
+        type=parse_date_option,
+        default=None,
+        metavar='YYYY-MM-DD',
+        help='Only show releases with a GA date on or before this date'
+    )
+    
+    parser.add_argument(
+        '--top',
+        type=parse_top_option,
+        default=2,
+        metavar='N',
+        help='Number of releases with the closest GA dates shown per product, or all (default: 2)'
+    )
+    
     parser.add_argument(
         '--no-version-filter',
         action='store_true',
         help='Disable version filtering from reference.txt'
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the parsed-export cache next to the CSV file'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Scan the CSV in chunks, keeping only rows that match a product or release (for exports larger than memory)'
+    )
+    
+    parser.add_argument(
+        '--csv-engine',
+        dest='csv_engine',
+        choices=CSV_ENGINES,
+        default='auto',
+        help='CSV parser backend: python (csv module, no pandas import), pandas (C parser), '
+             'pyarrow (multi-threaded, memory-mapped, Arrow-backed strings), or auto (python for '
+             f'exports up to {SMALL_EXPORT_BYTES // (1024 * 1024)} MB, pandas otherwise) (default: auto)'
+    )
+    
+    parser.add_argument(
+        '--export-dir',
+        dest='export_dir',
+        default=None,
+        help='Merge all Product-Pages-Export*.csv files in this directory, keyed on Release ID with the newest export winning'
+    )
+    
+    parser.add_argument(
+        '--export-order',
+        dest='export_order',
+        choices=EXPORT_ORDERS,
+        default='name',
+        help='How exports are ordered oldest to newest: by the date in the file name (falling back to mtime) or by mtime (default: name)'
+    )
+    
+    parser.add_argument(
+        '--delta',
+        nargs='?',
+        const=DELTA_STATE_FILE,
+        default=None,
+        metavar='STATE_FILE',
+        help=f'Remember per-release fingerprints and per-product results between runs and only re-search '
+             f'products whose rows changed (default state file: {DELTA_STATE_FILE})'
+    )
+    
+    parser.add_argument(
+        '--backend',
+        choices=BACKENDS,
+        default='pandas',
+        help='Where searches run: pandas (load the CSV export and search each product group), join (load the '
+             'CSV export and answer all product groups with one vectorized join) or sqlite (query the database '
+             'written by the import command) (default: pandas)'
+    )
+    
+    parser.add_argument(
+        '--db',
+        dest='db_file',
+        default=RELEASE_DB_FILE,
+        help=f'Path to the SQLite release database used by --backend sqlite (default: {RELEASE_DB_FILE})'
+    )
+    
+    args = parser.parse_args()
+    if args.output_file is None:
+        args.output_file = OUTPUT_FORMATS[args.output_format]
+    if args.stream_results and args.output_format != 'text':
+        parser.error('--stream-results applies to the text report; --format ndjson streams records')
+    if args.date_from and args.date_to and args.date_from > args.date_to:
+        parser.error('--from date is after --to date')
+    if args.export_dir and (args.csv_file or args.stream):
+        parser.error('--export-dir cannot be combined with --csv-file or --stream')
+    if args.backend == 'join' and args.delta:
+        parser.error('--backend join cannot be combined with --delta')
+    if args.backend == 'join' and args.stream_results:
+        parser.error('--backend join answers every product at once and cannot be combined with --stream-results')
+    if args.backend == 'sqlite' and (args.csv_file or args.stream or args.export_dir or args.delta):
+        parser.error('--backend sqlite cannot be combined with --csv-file, --stream, --export-dir or --delta')
+    return args
+
+def parse_import_arguments(argv):
+    """Parse command-line arguments of the import command"""
+    parser = argparse.ArgumentParser(
+        prog=f"{os.path.basename(sys.argv[0])} import",
+        description='Load a Product Pages export into the SQLite release database used by --backend sqlite. '
+                    'Releases already in the database are replaced by the imported rows with the same Release ID.'
+    )
+    
+    parser.add_argument(
+        '-c', '--csv-file',
+        dest='csv_file',
+        default=None,
+        help='Path to CSV file, optionally compressed (default: auto-detect the newest Product-Pages-Export-*.csv)'
+    )
+    
+    parser.add_argument(
+        '--db',
+        dest='db_file',
+        default=RELEASE_DB_FILE,
+        help=f'Path to the SQLite release database (default: {RELEASE_DB_FILE})'
+    )
+    
+    parser.add_argument(
+        '--csv-engine',
+        dest='csv_engine',
+        choices=DATAFRAME_ENGINES,
+        default='pandas',
+        help='CSV parser backend (default: pandas)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the parsed-export cache next to the CSV file'
+    )
+    
+    return parser.parse_args(argv)
+
+def parse_diff_arguments(argv):
+    """Parse command-line arguments of the diff command"""
+    parser = argparse.ArgumentParser(
+        prog=f"{os.path.basename(sys.argv[0])} diff",
+        description='Compare two result snapshots (written with --format json, ndjson, csv or parquet) or two '
+                    'Product Pages exports, keyed on (product, Release): added and removed releases and GA date '
+                    'shifts in days.'
+    )
+    
+    parser.add_argument('old', help='Older result snapshot or export')
+    
+    parser.add_argument('new', help='Newer result snapshot or export')
+    
+    parser.add_argument(
+        '-o', '--output',
+        dest='output_file',
+        default=STDOUT_OUTPUT,
+        help='Also write the differences to this file (default: console only)'
+    )
+    
+    parser.add_argument(
+        '--csv-engine',
+        dest='csv_engine',
+        choices=DATAFRAME_ENGINES,
+        default='pandas',
+        help='CSV parser backend for exports (default: pandas)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the parsed-export cache next to export CSV files'
+    )
+    
+    parser.add_argument(
+        '--show-all',
+        action='store_true',
+        help='Compare every GA date of exports, not just future ones'
+    )
+    
+    parser.add_argument(
+        '--from',
+        dest='date_from',
+        type=parse_date_option,
+        default=None,
+        metavar='YYYY-MM-DD',
+        help='Only compare export GA dates on or after this date (replaces the after-today filter)'
+    )
+    
+    parser.add_argument(
+        '--to',
+        dest='date_to',
+        type=parse_date_option,
+        default=None,
+        metavar='YYYY-MM-DD',
+        help='Only compare export GA dates on or before this date'
+    )
+    
+    args = parser.parse_args(argv)
+    if args.date_from and args.date_to and args.date_from > args.date_to:
+        parser.error('--from date is after --to date')
+    return args
+
+def export_sort_key(entry, order='name'):
+    """Sort key placing exports oldest to newest, by the date in the file name or by mtime"""
+    mtime_ns = entry.stat().st_mtime_ns
+    if order == 'name':
+        match = EXPORT_DATE_PATTERN.search(entry.name)
+        if match:
+            file_date = ''.join(match.groups())
+        else:
+            file_date = datetime.fromtimestamp(mtime_ns / 1e9).strftime('%Y%m%d')
+        return (file_date, mtime_ns, entry.name)
+    return (mtime_ns, entry.name)
+
+def split_export_name(name):
+    """Split an export file name into (base name, extension), or (None, None) if it is not a CSV export"""
+    for extension in EXPORT_EXTENSIONS:
+        if name.endswith(extension):
+            return name[:-len(extension)], extension
+    return None, None
+
+def scan_exports(directory='.', order='name'):
+    """Return the export CSV entries in directory, ordered oldest to newest"""
+    by_base_name = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            base_name, extension = split_export_name(entry.name)
+            if base_name is None or not entry.is_file():
+                continue
+            # Keep one file per export, preferring the compressed form
+            current = by_base_name.get(base_name)
+            if current is None or EXPORT_EXTENSIONS.index(extension) < EXPORT_EXTENSIONS.index(current[1]):
+                by_base_name[base_name] = (entry, extension)
+    csv_entries = [entry for entry, _ in by_base_name.values()]
+    exports = [entry for entry in csv_entries if entry.name.startswith(EXPORT_PREFIX)]
+    if not exports:
+        # Results written with --format csv (results.csv by default) are not exports
+        exports = [entry for entry in csv_entries if not is_result_snapshot(entry.path)]
+    return sorted(exports, key=lambda entry: export_sort_key(entry, order))
+
+def find_csv_file(order='name'):
+    """Auto-detect the newest export CSV in the current directory"""
+    exports = scan_exports('.', order)
+    if exports:
+        return exports[-1].name
+    return None
+
+def file_content_hash(path, chunk_size=1024 * 1024):
+    """Return a hex digest of the file contents"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def export_cache_key(csv_file):
+    """Build the cache key (path, size, mtime) for an export; the content hash is added lazily"""
+    stat = os.stat(csv_file)
+    return {
+        'version': CACHE_FORMAT_VERSION,
+        'path': os.path.abspath(csv_file),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }
+
+def read_cache_key(cache_file):
+    """Read the key stored in a cache file's schema metadata, or None if unreadable"""
+    import pyarrow.ipc as ipc
+    try:
+        with ipc.open_file(cache_file) as reader:
+            metadata = reader.schema.metadata or {}
+        return json.loads(metadata[CACHE_METADATA_KEY])
+    except Exception:
+        return None
+
+def write_cache_file(df, cache_file, key):
+    """Write df as Feather with key stored in the schema metadata, replacing cache_file atomically"""
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[CACHE_METADATA_KEY] = json.dumps(key).encode('utf-8')
+    table = table.replace_schema_metadata(metadata)
+    
+    # Write to a temporary file first so a concurrent run never sees a partial cache
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        feather.write_feather(table, tmp_file)
+        os.replace(tmp_file, cache_file)
+    finally:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+    return cache_file
 
-def load_csv_data(csv_file=None):
+def missing_as_nan(df):
+    """Replace None in object columns with NaN, as read_csv produces"""
+    for col in df.columns:
+        if df[col].dtype == object:
+            values = df[col].to_numpy(dtype=object, copy=True)
+            values[pd.isna(values)] = float('nan')
+            df[col] = pd.Series(values, index=df.index, dtype=object)
+    return df
+
+def read_cache_file(cache_file, engine='pandas'):
+    """Read a Feather cache file back into a DataFrame"""
+    import pyarrow.feather as feather
+    table = feather.read_table(cache_file, memory_map=True)
+    if engine == 'pyarrow':
+        return arrow_table_to_frame(table)
+    # Arrow hands back None for missing strings
+    return missing_as_nan(table.combine_chunks().to_pandas())
+
+def arrow_string_dtype():
+    """Return the Arrow-backed pandas string dtype, with NaN for missing values where supported"""
     try:
-        if csv_file:
-            print(f"Loading: {csv_file}")
-            df = pd.read_csv(csv_file)
-            print(f"Loaded {len(df)} records")
+        return pd.StringDtype('pyarrow', na_value=float('nan'))
+    except TypeError:
+        pass
+    try:
+        return pd.StringDtype('pyarrow_numpy')
+    except (TypeError, ValueError):
+        return pd.StringDtype('pyarrow')
+
+def arrow_table_to_frame(table):
+    """Convert an Arrow table to a DataFrame whose string columns stay Arrow-backed"""
+    import pyarrow as pa
+    string_dtype = arrow_string_dtype()
+    string_types = (pa.string(), pa.large_string())
+    # One contiguous chunk per column: row selection on many-chunk columns is far slower
+    table = table.combine_chunks()
+    return table.to_pandas(types_mapper=lambda arrow_type: string_dtype if arrow_type in string_types else None)
+
+def combine_arrow_chunks(df):
+    """Rejoin Arrow-backed columns that the parser built from several chunks"""
+    for col in df.columns:
+        to_arrow = getattr(df[col].array, '__arrow_array__', None)
+        if to_arrow is None:
+            continue
+        chunked = to_arrow()
+        if getattr(chunked, 'num_chunks', 1) > 1:
+            df[col] = pd.array(chunked.combine_chunks(), dtype=df[col].dtype)
+    return df
+
+def load_cached_export(csv_file, key, stats, engine='pandas'):
+    """Return the cached DataFrame for csv_file if the cache is still valid, else None"""
+    cache_file = csv_file + CACHE_SUFFIX
+    if not os.path.exists(cache_file):
+        stats['reason'] = 'no cache file'
+        return None
+    
+    cached_key = read_cache_key(cache_file)
+    if cached_key is None:
+        stats['reason'] = 'unreadable cache file'
+        return None
+    if cached_key.get('version') != key['version'] or cached_key.get('path') != key['path'] \
+            or cached_key.get('size') != key['size']:
+        stats['reason'] = 'export changed'
+        return None
+    
+    # Size and mtime match: trust the cache without hashing the export
+    if cached_key.get('mtime_ns') != key['mtime_ns']:
+        key['hash'] = file_content_hash(csv_file)
+        if cached_key.get('hash') != key['hash']:
+            stats['reason'] = 'export changed'
+            return None
+        stats['rewrite'] = True
+    else:
+        key['hash'] = cached_key.get('hash')
+    
+    return read_cache_file(cache_file, engine)
+
+def save_cached_export(df, csv_file, key):
+    """Write df to the cache file next to csv_file, tagged with the export's key"""
+    if 'hash' not in key:
+        key['hash'] = file_content_hash(csv_file)
+    return write_cache_file(df, csv_file + CACHE_SUFFIX, key)
+
+def restore_export_dtypes(df):
+    """Re-apply categorical dtypes lost when concatenating frames with different categories"""
+    for col in df.columns:
+        if EXPORT_DTYPES.get(col) == 'category' and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
+
+def parse_ga_dates(values):
+    """Parse the GA date column once at load time into datetime64
+
+    Values matching GA_DATE_FORMAT take the fast fixed-format path. Anything else
+    (other or mixed formats, malformed strings) is inferred once per distinct string,
+    and strings that cannot be parsed become NaT.
+    """
+    parsed = pd.to_datetime(values, format=GA_DATE_FORMAT, errors='coerce', cache=True)
+    leftover = parsed.isna() & values.notna()
+    if leftover.any():
+        leftover_values = values[leftover]
+        unique_values = pd.unique(leftover_values)
+        inferred = dict(zip(unique_values, pd.to_datetime(unique_values, format='mixed', errors='coerce')))
+        parsed[leftover] = leftover_values.map(inferred)
+    return parsed
+
+def export_usecols(csv_file, engine='pandas'):
+    """Return the export columns present in csv_file, failing fast if a required one is missing"""
+    if engine == 'pyarrow':
+        import pyarrow.csv as pa_csv
+        with open_arrow_source(csv_file) as source:
+            header = pa_csv.open_csv(source).schema.names
+    else:
+        header = pd.read_csv(csv_file, nrows=0).columns
+    missing = [col for col in EXPORT_COLUMNS if col not in header and col not in OPTIONAL_EXPORT_COLUMNS]
+    if missing:
+        raise ValueError(f"{csv_file} is missing required column(s): {', '.join(missing)}")
+    return [col for col in EXPORT_COLUMNS if col in header]
+
+def open_arrow_source(csv_file):
+    """Open csv_file for pyarrow: memory-mapped if plain, decompressed on the fly otherwise"""
+    import pyarrow as pa
+    if csv_file.endswith('.csv'):
+        return pa.memory_map(csv_file)
+    if csv_file.endswith('.xz'):
+        # Arrow has no xz codec; stream through the standard library instead
+        return lzma.open(csv_file, 'rb')
+    return pa.input_stream(csv_file, compression='detect')
+
+def read_csv_pyarrow(csv_file, usecols):
+    """Read the export with pyarrow's multi-threaded CSV reader over a memory-mapped file"""
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.compute as pc
+    
+    read_options = pa_csv.ReadOptions(use_threads=True)
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=usecols,
+        column_types={col: pa.string() for col in usecols},
+        null_values=sorted(CSV_NA_VALUES),
+        strings_can_be_null=True,
+    )
+    with open_arrow_source(csv_file) as source:
+        table = pa_csv.read_csv(source, read_options=read_options, convert_options=convert_options)
+    
+    for col in usecols:
+        if EXPORT_DTYPES[col] == 'category':
+            table = table.set_column(table.schema.get_field_index(col), col, pc.dictionary_encode(table[col]))
+    return arrow_table_to_frame(table)
+
+def parse_export_csv(csv_file, engine='pandas'):
+    """Read only the columns the tool uses, with pinned dtypes and parsed GA dates"""
+    usecols = export_usecols(csv_file, engine)
+    if engine == 'pyarrow':
+        df = read_csv_pyarrow(csv_file, usecols)
+    else:
+        df = pd.read_csv(csv_file, usecols=usecols, dtype={col: EXPORT_DTYPES[col] for col in usecols})
+        df = combine_arrow_chunks(df)
+    df = df[usecols]
+    df['GA date'] = parse_ga_dates(df['GA date'])
+    return df
+
+def read_export(csv_file, use_cache=True, engine='pandas'):
+    """Parse an export CSV, going through the on-disk cache when possible"""
+    stats = {}
+    start = time.perf_counter()
+    
+    if use_cache:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            use_cache = False
+            stats['status'] = 'unavailable (pyarrow not installed)'
+    else:
+        stats['status'] = 'disabled (--no-cache)'
+    
+    if use_cache:
+        key = export_cache_key(csv_file)
+        try:
+            df = load_cached_export(csv_file, key, stats, engine)
+        except Exception as e:
+            stats['reason'] = f"unreadable cache file ({e})"
+            df = None
+        
+        if df is not None:
+            elapsed = time.perf_counter() - start
+            print(f"Cache: hit {csv_file}{CACHE_SUFFIX} (loaded in {elapsed:.3f}s)")
+            if stats.get('rewrite'):
+                try:
+                    save_cached_export(df, csv_file, key)
+                except Exception:
+                    pass
             return df
+    
+    df = parse_export_csv(csv_file, engine)
+    elapsed = time.perf_counter() - start
+    
+    if use_cache:
+        try:
+            cache_file = save_cached_export(df, csv_file, key)
+            print(f"Cache: miss, {stats.get('reason', 'rebuilt')} (parsed in {elapsed:.3f}s, cached to {cache_file})")
+        except Exception as e:
+            print(f"Cache: miss, {stats.get('reason', 'rebuilt')} (parsed in {elapsed:.3f}s, cache not written: {e})")
+    else:
+        print(f"Cache: {stats['status']} (parsed in {elapsed:.3f}s)")
+    return df
+
+def load_csv_data(csv_file=None, use_cache=True, engine='pandas', order='name'):
+    try:
+        if not csv_file:
+            csv_file = find_csv_file(order)
+            if not csv_file:
+                print("Error: No CSV file found")
+                return None
+        
+        print(f"Loading: {csv_file} ({engine} engine)")
+        df = read_export(csv_file, use_cache, engine)
+        print(f"Loaded {len(df)} records")
+        return df
+        
+    except Exception as e:
+        print(f"Error: {e}")
+        return None
+
+def export_file_entry(path):
+    """Identify an export file by name, size and mtime for the merge state"""
+    stat = os.stat(path)
+    return {'name': os.path.basename(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def merge_newest_wins(merged, newer):
+    """Overlay newer on merged: every Release ID present in newer replaces all of its older rows"""
+    if merged is None:
+        return newer.reset_index(drop=True)
+    newer_ids = set(newer['Release ID'].dropna())
+    kept = merged[~merged['Release ID'].isin(newer_ids)]
+    merged = pd.concat([kept, newer], ignore_index=True)
+    # Rows without a Release ID cannot be keyed; drop exact repeats, keeping the newest copy
+    repeated = merged['Release ID'].isna() & merged.duplicated(keep='last')
+    if repeated.any():
+        merged = merged[~repeated].reset_index(drop=True)
+    return restore_export_dtypes(merged)
+
+def load_export_dir(export_dir, use_cache=True, engine='pandas', order='name'):
+    """Merge every export in export_dir into one frame keyed on Release ID, newest export winning"""
+    try:
+        exports = scan_exports(export_dir, order)
+        if not exports:
+            print(f"Error: No CSV file found in {export_dir}")
+            return None
+        
+        files = [export_file_entry(entry.path) for entry in exports]
+        state_file = os.path.join(export_dir, MERGE_STATE_FILE)
+        merged = None
+        merged_count = 0
+        
+        # Reuse the previous merge when the exports it covered are unchanged and still the oldest ones
+        if use_cache and os.path.exists(state_file):
+            state = read_cache_key(state_file)
+            state_files = (state or {}).get('files', [])
+            if state and state.get('version') == CACHE_FORMAT_VERSION and state_files == files[:len(state_files)]:
+                merged = read_cache_file(state_file, engine)
+                merged_count = len(state_files)
+        
+        print(f"Merging {len(files)} export(s) from {export_dir} "
+              f"({merged_count} from previous merge, {len(files) - merged_count} to parse)")
+        for entry in exports[merged_count:]:
+            print(f"Loading: {entry.path} ({engine} engine)")
+            df = read_export(entry.path, use_cache, engine)
+            if 'Release ID' not in df.columns:
+                raise ValueError(f"{entry.path} has no Release ID column, cannot merge exports")
+            merged = merge_newest_wins(merged, df)
+        
+        if use_cache and merged_count < len(files):
+            try:
+                write_cache_file(merged, state_file, {'version': CACHE_FORMAT_VERSION, 'files': files})
+            except Exception as e:
+                print(f"Warning: merge state not written: {e}")
+        
+        print(f"Loaded {len(merged)} records")
+        return merged
+        
+    except Exception as e:
+        print(f"Error: {e}")
+        return None
+
+def stream_csv_data(csv_file, operator_product_pairs, chunk_rows=STREAM_CHUNK_ROWS):
+    """Scan the export in chunks and return only the rows any product/release search can match"""
+    try:
+        if not csv_file:
+            csv_file = find_csv_file()
+            if not csv_file:
+                print("Error: No CSV file found")
+                return None
+        
+        print(f"Streaming: {csv_file} ({chunk_rows} rows per chunk)")
+        queries = list(OrderedDict.fromkeys(
+            (item[1], item[2] if len(item) == 3 else "") for item in operator_product_pairs if item[1]
+        ))
+        needles = search_needles(group_operators_by_product(operator_product_pairs))
+        
+        usecols = export_usecols(csv_file)
+        reader = pd.read_csv(csv_file, usecols=usecols, dtype={col: EXPORT_DTYPES[col] for col in usecols},
+                             chunksize=chunk_rows)
+        candidates = []
+        total_rows = 0
+        with reader:
+            for chunk in reader:
+                total_rows += len(chunk)
+                chunk = chunk[usecols]
+                # search_positions on a chunk returns a superset of that chunk's rows in the
+                # in-memory result, so re-running the search on the candidates is exact.
+                # Each chunk is indexed once and shared by every query
+                cache = SearchCache(chunk, MultiPatternIndex(chunk, needles))
+                matched = set()
+                for product, release_name in queries:
+                    matched.update(cache.search(product, release_name).tolist())
+                if matched:
+                    candidates.append(chunk.iloc[sorted(matched)])
+        
+        if candidates:
+            df = pd.concat(candidates)
         else:
-            product_pages_files = [f for f in os.listdir('.') if f.startswith('Product-Pages-Export') and f.endswith('.csv')]
-            if product_pages_files:
-                csv_file = product_pages_files[0]
-            else:
-                csv_files = [f for f in os.listdir('.') if f.endswith('.csv')]
-                if not csv_files:
-                    print("Error: No CSV file found")
-                    return None
-                csv_file = csv_files[0]
-            
-            print(f"Loading: {csv_file}")
-            
-            df = pd.read_csv(csv_file)
-            print(f"Loaded {len(df)} records")
-            return df
+            df = pd.DataFrame(columns=usecols)
+        df = restore_export_dtypes(df)
+        df['GA date'] = parse_ga_dates(df['GA date'])
+        
+        print(f"Scanned {total_rows} records, kept {len(df)} candidate records")
+        return df
         
     except Exception as e:
         print(f"Error: {e}")
         return None
 
-def load_reference_versions(reference_file='reference.txt'):
-    """Load reference versions from reference.txt and create a mapping"""
+class ReleaseRecord:
+    """One export row for the pure-Python engine, with the export's columns as attributes
+
+    Missing cells hold MISSING (NaN) so they print as pandas prints them; columns absent
+    from the export hold None. Records support row['Column'] and row.get() like a pandas row.
+    """
+    __slots__ = tuple(COLUMN_KEYS.values())
+    
+    def __init__(self, values):
+        for attr, value in zip(self.__slots__, values):
+            setattr(self, attr, value)
+    
+    def __getitem__(self, column):
+        return getattr(self, COLUMN_KEYS[column])
+    
+    def get(self, column, default=None):
+        value = getattr(self, COLUMN_KEYS[column], None) if column in COLUMN_KEYS else None
+        return default if value is None else value
+    
+    def key(self):
+        """All values of the row, for drop_duplicates-style de-duplication"""
+        return tuple(getattr(self, attr) for attr in self.__slots__)
+
+def open_text_export(csv_file):
+    """Open an export for the csv module, or return None if its compression needs another engine"""
+    if csv_file.endswith('.gz'):
+        import gzip
+        return gzip.open(csv_file, 'rt', encoding='utf-8-sig', newline='')
+    if csv_file.endswith('.xz'):
+        return lzma.open(csv_file, 'rt', encoding='utf-8-sig', newline='')
+    if csv_file.endswith('.zst'):
+        return None
+    return open(csv_file, 'r', encoding='utf-8-sig', newline='')
+
+def read_csv_records(csv_file):
+    """Parse an export with the csv module, or return None if it needs the pandas engine"""
+    source = open_text_export(csv_file)
+    if source is None:
+        return None
+    
+    with source:
+        reader = csv.reader(source)
+        header = next(reader, None)
+        if header is None:
+            return None
+        positions = [header.index(col) if col in header else None for col in EXPORT_COLUMNS]
+        if any(pos is None for col, pos in zip(EXPORT_COLUMNS, positions) if col not in OPTIONAL_EXPORT_COLUMNS):
+            return None
+        ga_date_pos = EXPORT_COLUMNS.index('GA date')
+        
+        records = []
+        parsed_dates = {}
+        for row in reader:
+            if not row:
+                continue
+            values = []
+            for pos in positions:
+                if pos is None:
+                    values.append(None)
+                elif pos >= len(row) or row[pos] in CSV_NA_VALUES:
+                    values.append(MISSING)
+                else:
+                    values.append(row[pos])
+            
+            ga_date = values[ga_date_pos]
+            if ga_date is not MISSING:
+                if ga_date not in parsed_dates:
+                    try:
+                        parsed_dates[ga_date] = datetime.strptime(ga_date, GA_DATE_FORMAT)
+                    except ValueError:
+                        # Other date formats are inferred by the pandas engine
+                        return None
+                values[ga_date_pos] = parsed_dates[ga_date]
+            records.append(ReleaseRecord(values))
+    return records
+
+def load_csv_records(csv_file):
+    """Load an export with the pure-Python engine; None means the pandas engine should be used instead"""
+    try:
+        start = time.perf_counter()
+        records = read_csv_records(csv_file)
+    except Exception:
+        records = None
+    if records is None:
+        print("Export not supported by the python engine, using pandas")
+        return None
+    print(f"Parsed in {time.perf_counter() - start:.3f}s (python engine)")
+    print(f"Loaded {len(records)} records")
+    return records
+
+def choose_csv_engine(csv_file, args):
+    """Resolve --csv-engine: auto uses the python engine for small exports in the plain report mode"""
+    engine = args.csv_engine
+    needs_dataframe = args.stream or args.export_dir or args.delta or args.backend != 'pandas'
+    if engine == 'auto':
+        engine = 'pandas'
+        if not needs_dataframe and csv_file and not csv_file.endswith('.zst'):
+            try:
+                if os.path.getsize(csv_file) <= SMALL_EXPORT_BYTES:
+                    engine = 'python'
+            except OSError:
+                pass
+    elif engine == 'python' and needs_dataframe:
+        engine = 'pandas'
+    return engine
+
+@functools.lru_cache(maxsize=None)
+def release_version(text):
+    """(major, minor) or (major, minor, patch) of the first version number in text, or None
+
+    The first number is the product's own version; later ones name a platform, as in
+    'Red Hat OpenShift Logging 6.3 for OpenShift 4.19'.
+    """
+    match = VERSION_PATTERN.search(text)
+    if match is None:
+        return None
+    major, minor, patch = match.groups()
+    return (int(major), int(minor), int(patch)) if patch else (int(major), int(minor))
+
+def version_key(version):
+    """Integer sort key of a version tuple, comparing like the tuple itself at that length"""
+    key = version[0] * VERSION_KEY_BASE + version[1]
+    if len(version) == 3:
+        # A missing patch sorts before patch 0, as (4, 20) < (4, 20, 0)
+        key = key * VERSION_KEY_BASE + version[2] + 1
+    return key
+
+@functools.lru_cache(maxsize=None)
+def parse_version_spec(spec):
+    """Parse a reference.txt version filter into ('latest', n) or ('bounds', [(comparison, version), ...])"""
+    words = spec.split()
+    if len(words) == 2 and words[0].lower() == 'latest' and words[1].isdigit() and int(words[1]) > 0:
+        return 'latest', int(words[1])
+    bounds = []
+    for part in spec.split(','):
+        match = VERSION_BOUND_PATTERN.match(part.strip())
+        if not match:
+            raise ValueError(f"invalid version filter '{spec}'")
+        comparison, *numbers = match.groups()
+        bounds.append((VERSION_COMPARISONS[comparison or '=='], tuple(int(n) for n in numbers if n is not None)))
+    return 'bounds', bounds
+
+def version_columns(column):
+    """Integer major, minor and patch arrays (-1 where absent) for the version in each value of column"""
+    codes, uniques = pd.factorize(column)
+    # Parsed once per distinct value; the trailing entry is for missing values (code -1)
+    versions = [release_version(value) if isinstance(value, str) else None for value in list(uniques)] + [None]
+    table = np.array([(version + (-1,))[:3] if version else (-1, -1, -1) for version in versions], dtype=np.int64)
+    rows = table[np.asarray(codes)]
+    return rows[:, 0], rows[:, 1], rows[:, 2]
+
+class VersionIndex:
+    """Release versions parsed once per export into integer major/minor/patch columns
+
+    A row's version is the first major.minor[.patch] in its Release, or in its Release
+    shortname when the Release has none; rows without a version never pass a version filter.
+    """
+    
+    def __init__(self, df):
+        self.major, self.minor, self.patch = version_columns(df['Release'])
+        if 'Release shortname' in df.columns and (self.major < 0).any():
+            missing = self.major < 0
+            short_major, short_minor, short_patch = version_columns(df['Release shortname'])
+            self.major = np.where(missing, short_major, self.major)
+            self.minor = np.where(missing, short_minor, self.minor)
+            self.patch = np.where(missing, short_patch, self.patch)
+        self.minor_key = self.major * VERSION_KEY_BASE + self.minor
+        self.patch_key = self.minor_key * VERSION_KEY_BASE + self.patch + 1
+    
+    def matches(self, specs, positions=None):
+        """Boolean mask of the rows (or of the rows at positions) whose version passes any of specs"""
+        if positions is None:
+            positions = slice(None)
+        has_version = self.major[positions] >= 0
+        minor_key = self.minor_key[positions]
+        patch_key = self.patch_key[positions]
+        
+        # Exact versions, the common case, are answered together by one lookup per key length
+        exact = {2: set(), 3: set()}
+        keep = np.zeros(len(minor_key), dtype=bool)
+        for kind, value in (parse_version_spec(spec) for spec in specs):
+            if kind == 'latest':
+                # The distinct minors come back sorted, so the newest n are at the end
+                keep |= np.isin(minor_key, np.unique(minor_key[has_version])[-value:])
+            elif len(value) == 1 and value[0][0] is eq:
+                exact[len(value[0][1])].add(version_key(value[0][1]))
+            else:
+                in_bounds = np.ones(len(minor_key), dtype=bool)
+                for comparison, bound in value:
+                    in_bounds &= comparison(minor_key if len(bound) == 2 else patch_key, version_key(bound))
+                keep |= in_bounds
+        if exact[2]:
+            keep |= np.isin(minor_key, list(exact[2]))
+        if exact[3]:
+            keep |= np.isin(patch_key, list(exact[3]))
+        return has_version & keep
+
+def row_version(release, release_shortname):
+    """Version tuple of a row, from its Release or else its Release shortname, or None, as VersionIndex parses it"""
+    version = None
+    if isinstance(release, str):
+        version = release_version(release)
+    if version is None and isinstance(release_shortname, str):
+        version = release_version(release_shortname)
+    return version
+
+def record_version_key(record):
+    """(minor key, patch key) of a ReleaseRecord's version, or None, as VersionIndex computes it"""
+    version = row_version(record.release, record.release_shortname)
+    if version is None:
+        return None
+    return version_key(version[:2]), version_key((version + (-1,))[:3])
+
+def python_filter_by_version(records, specs):
+    """filter_by_version for the pure-Python engine"""
+    keys = [record_version_key(record) for record in records]
+    keep = [False] * len(records)
+    for kind, value in (parse_version_spec(spec) for spec in specs):
+        if kind == 'latest':
+            latest = set(sorted({key[0] for key in keys if key})[-value:])
+            passes = [bool(key) and key[0] in latest for key in keys]
+        else:
+            passes = [bool(key) and all(comparison(key[len(bound) - 2], version_key(bound)) for comparison, bound in value)
+                      for key in keys]
+        keep = [kept or passed for kept, passed in zip(keep, passes)]
+    return [record for record, kept in zip(records, keep) if kept]
+
+def parse_date_option(value):
+    """argparse type for the YYYY-MM-DD dates of --from and --to"""
+    try:
+        return datetime.strptime(value, GA_DATE_FORMAT).date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', expected YYYY-MM-DD")
+
+def parse_top_option(value):
+    """argparse type for --top: a positive number of releases, or all (None)"""
+    if value.lower() == 'all':
+        return None
+    try:
+        count = int(value)
+    except ValueError:
+        count = 0
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"invalid count '{value}', expected a positive number or all")
+    return count
+
+def release_window(show_all=False, date_from=None, date_to=None):
+    """GA date window (start, stop) of the reported releases, half-open, None for an open end
+
+    The window starts at date_from, or tomorrow (after today) unless show_all is set,
+    and includes the whole day of date_to.
+    """
+    if date_from:
+        start = date_from
+    else:
+        start = None if show_all else date.today() + timedelta(days=1)
+    stop = date_to + timedelta(days=1) if date_to else None
+    return start, stop
+
+def describe_window(show_all=False, date_from=None, date_to=None):
+    """Report wording of a --from/--to window, or None when neither option is set"""
+    if not (date_from or date_to):
+        return None
+    if date_from and date_to:
+        return f"from {date_from} to {date_to}"
+    if date_from:
+        return f"on or after {date_from}"
+    if show_all:
+        return f"on or before {date_to}"
+    return f"after {date.today()} and on or before {date_to}"
+
+class DateIndex:
+    """GA dates of one loaded export, sorted once, for bisecting release date windows
+
+    Each row holds the rank of its GA date among the sorted distinct dates, so the candidates
+    of a search are put in date order by one integer sort and a date window is two bisections
+    into them. Rows without a GA date rank after every date and fall outside every window.
+    """
+    
+    def __init__(self, dates):
+        values = np.asarray(dates.to_numpy())
+        missing = np.isnat(values)
+        self.dates = np.unique(values[~missing])
+        self.ranks = np.searchsorted(self.dates, values)
+        self.ranks[missing] = len(self.dates)
+    
+    def bounds(self, start=None, stop=None):
+        """Rank range [low, high) of the GA dates in the window [start, stop)"""
+        low = 0 if start is None else np.searchsorted(self.dates, np.datetime64(start), 'left')
+        high = len(self.dates) if stop is None else np.searchsorted(self.dates, np.datetime64(stop), 'left')
+        return low, high
+    
+    def window(self, positions, start=None, stop=None):
+        """The positions whose GA date is in [start, stop), in GA date order; equal dates keep their order"""
+        ranks = self.ranks[positions]
+        order = np.argsort(ranks, kind='stable')
+        ranks = ranks[order]
+        low, high = self.bounds(start, stop)
+        return positions[order[np.searchsorted(ranks, low, 'left'):np.searchsorted(ranks, high, 'left')]]
+
+def load_product_aliases(aliases_file='aliases.txt'):
+    """Load the alias table mapping reference.txt abbreviations to full product names"""
+    aliases = dict(DEFAULT_PRODUCT_ALIASES)
+    try:
+        if not os.path.exists(aliases_file):
+            return aliases
+        
+        with open(aliases_file, 'r', encoding='utf-8') as f:
+            lines = [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+        
+        for line in lines:
+            # Parse lines like "OCP, OPENSHIFT<TAB>Red Hat OpenShift Container Platform"
+            parts = line.split('\t')
+            if len(parts) < 2 or not parts[-1].strip():
+                print(f"Warning: malformed line in {aliases_file} ignored: {line}")
+                continue
+            product = parts[-1].strip()
+            for alias in parts[0].split(','):
+                if alias.strip():
+                    aliases[alias.strip().upper()] = product
+        
+        print(f"Loaded {len(aliases)} product aliases from {aliases_file}")
+        return aliases
+        
+    except Exception as e:
+        print(f"Error loading {aliases_file}: {e}")
+        return aliases
+
+def load_reference_versions(reference_file='reference.txt', aliases=None):
+    """Load reference versions from reference.txt and map each product to its list of version filters"""
+    if aliases is None:
+        aliases = DEFAULT_PRODUCT_ALIASES
     version_map = {}
     try:
         if not os.path.exists(reference_file):
@@ -104,23 +1273,28 @@ def load_reference_versions(reference_file='reference.txt'):
             lines = [line.strip() for line in f if line.strip()]
         
         for line in lines:
-            # Parse lines like "OCP 4.20", "ACM 2.15", "Quay 3.15", "ODF 4.20"
+            # Parse lines like "OCP 4.20", "ACM 2.15", "Quay 3.15", "ODF >=4.18,<4.21", "OCP latest 2";
+            # a product listed on several lines keeps every one of its versions
             parts = line.split()
             if len(parts) >= 2:
                 product_abbr = parts[0].upper()
-                version = parts[1]
+                version = ' '.join(parts[1:])
+                try:
+                    parse_version_spec(version)
+                except ValueError as e:
+                    print(f"Warning: {e} in {reference_file}, line ignored")
+                    continue
                 
                 # Map abbreviations to full product names
-                if product_abbr == "OCP":
-                    version_map["Red Hat OpenShift Container Platform"] = version
-                elif product_abbr == "ACM":
-                    version_map["Red Hat Advanced Cluster Management for Kubernetes"] = version
-                elif product_abbr == "QUAY":
-                    version_map["Red Hat Quay"] = version
-                elif product_abbr == "ODF":
-                    version_map["Red Hat OpenShift Data Foundation"] = version
-        
-        print(f"Loaded {len(version_map)} version filters from {reference_file}")
+                product = aliases.get(product_abbr)
+                if product is None:
+                    print(f"Warning: unknown product alias '{parts[0]}' in {reference_file}, line ignored")
+                    continue
+                version_map.setdefault(product, [])
+                if version not in version_map[product]:
+                    version_map[product].append(version)
+        
+        print(f"Loaded {sum(len(versions) for versions in version_map.values())} version filters from {reference_file}")
         return version_map
         
     except Exception as e:
@@ -166,271 +1340,1608 @@ def load_search_items(source_file='source.txt'):
         print(f"Error loading {source_file}: {e}")
         return []
 
-def search_by_product(df, product_name, release_name=None):
+@functools.lru_cache(maxsize=None)
+def fold_text(text):
+    """Casefolded, NFKC-normalized form of text that all case-insensitive matching compares"""
+    return unicodedata.normalize('NFKC', text).casefold()
+
+class FoldedColumn:
+    """Casefolded copy of one export column, stored once per distinct value
+
+    Substring tests become literal containment checks against these folded values,
+    without converting or lowercasing the column again for every query.
+    """
+    
+    def __init__(self, column):
+        codes, uniques = pd.factorize(column)
+        self.codes = np.asarray(codes)
+        # Missing values (code -1) and non-string values never match
+        self.values = [fold_text(value) if isinstance(value, str) else None for value in list(uniques)]
+    
+    def value_ids(self, needle, candidates=None):
+        """Ids of the distinct values containing needle, checked among candidates if given"""
+        folded = fold_text(needle)
+        values = self.values
+        if candidates is None:
+            candidates = range(len(values))
+        return [value_id for value_id in candidates if values[value_id] is not None and folded in values[value_id]]
+    
+    def mask(self, value_ids, positions=None):
+        """Boolean mask of the rows (or of the rows at positions) holding one of value_ids"""
+        # One extra False slot so missing values (code -1) never match
+        hits = np.zeros(len(self.values) + 1, dtype=bool)
+        hits[value_ids] = True
+        return hits[self.codes if positions is None else self.codes[positions]]
+    
+    def contains(self, needle, positions=None):
+        """Boolean mask of the rows (or of the rows at positions) whose value contains needle"""
+        if positions is None:
+            return self.mask(self.value_ids(needle))
+        codes = self.codes[positions]
+        present = np.unique(codes[codes >= 0]).tolist()
+        return self.mask(self.value_ids(needle, present), positions)
+
+class TrigramIndex:
+    """Trigram index over the folded distinct values of one export column
+
+    A substring query is narrowed to the values containing every trigram of the folded
+    needle, which are then checked for literal containment.
+    """
+    
+    def __init__(self, folded):
+        self.folded = folded
+        self.postings = {}
+        postings = self.postings
+        for value_id, value in enumerate(folded.values):
+            if value is None:
+                continue
+            for i in range(len(value) - TRIGRAM_SIZE + 1):
+                gram = value[i:i + TRIGRAM_SIZE]
+                if gram in postings:
+                    postings[gram].add(value_id)
+                else:
+                    postings[gram] = {value_id}
+    
+    def candidates(self, needle):
+        """Ids of the distinct values that may contain needle"""
+        folded = fold_text(needle)
+        if len(folded) < TRIGRAM_SIZE:
+            return None
+        postings = sorted((self.postings.get(folded[i:i + TRIGRAM_SIZE], set())
+                           for i in range(len(folded) - TRIGRAM_SIZE + 1)), key=len)
+        return sorted(postings[0].intersection(*postings[1:]))
+    
+    def search(self, needle):
+        """Boolean row mask of the values containing needle"""
+        return self.folded.mask(self.folded.value_ids(needle, self.candidates(needle)))
+
+class SearchIndex:
+    """Folded copies and trigram indexes of the searchable columns of one loaded export, built on first use"""
+    
+    def __init__(self, df):
+        self.df = df
+        self.folded = {}
+        self.columns = {}
+        self.versions = None
+        self.dates = None
+    
+    def folded_column(self, col):
+        """The FoldedColumn of col, built once per export"""
+        if col not in self.folded:
+            self.folded[col] = FoldedColumn(self.df[col])
+        return self.folded[col]
+    
+    def version_index(self):
+        """The VersionIndex of the export, built once"""
+        if self.versions is None:
+            self.versions = VersionIndex(self.df)
+        return self.versions
+    
+    def date_index(self):
+        """The DateIndex of the export's GA dates, built once"""
+        if self.dates is None:
+            self.dates = DateIndex(self.df['GA date'])
+        return self.dates
+    
+    def positions(self, col, needle):
+        """Positions of the export rows whose col contains needle"""
+        if col not in self.columns:
+            self.columns[col] = TrigramIndex(self.folded_column(col))
+        return np.flatnonzero(self.columns[col].search(needle))
+
+class AhoCorasick:
+    """Aho-Corasick automaton reporting which of its patterns occur in a text"""
+    
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                next_state = self.goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                    self.goto[state][ch] = next_state
+                state = next_state
+            self.output[state] += (pattern_id,)
+        
+        # Breadth-first, so every failure link points at an already finished state
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(ch, 0)
+                self.output[next_state] += self.output[self.fail[next_state]]
+    
+    def search(self, text):
+        """Ids of the patterns occurring in text"""
+        goto, fail, output = self.goto, self.fail, self.output
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+class MultiPatternIndex:
+    """Matches of every search needle, found with one Aho-Corasick pass per searchable column
+
+    column_needles maps each column to the needles it will be searched for. positions() answers
+    those from the precomputed matches and any other query through a SearchIndex.
+    """
+    
+    def __init__(self, df, column_needles):
+        self.df = df
+        self.columns = {}
+        self.fallback = SearchIndex(df)
+        for col, needles in column_needles.items():
+            if col in df.columns:
+                self.columns[col] = self.scan(self.folded_column(col), needles)
+    
+    def folded_column(self, col):
+        """The FoldedColumn of col, shared with the fallback index"""
+        return self.fallback.folded_column(col)
+    
+    def version_index(self):
+        """The VersionIndex of the export, shared with the fallback index"""
+        return self.fallback.version_index()
+    
+    def date_index(self):
+        """The DateIndex of the export, shared with the fallback index"""
+        return self.fallback.date_index()
+    
+    def scan(self, folded, needles):
+        """Return {needle: ids of the folded distinct values containing it} for one column"""
+        needles = sorted(set(needles))
+        patterns = sorted({fold_text(needle) for needle in needles})
+        pattern_ids = {pattern: pattern_id for pattern_id, pattern in enumerate(patterns)}
+        automaton = AhoCorasick(patterns)
+        
+        pattern_hits = [[] for _ in patterns]
+        present = []
+        for value_id, value in enumerate(folded.values):
+            if value is None:
+                continue
+            present.append(value_id)
+            for pattern_id in automaton.search(value):
+                pattern_hits[pattern_id].append(value_id)
+        
+        # The automaton never reports an empty pattern, which every value contains
+        return {needle: present if not fold_text(needle) else pattern_hits[pattern_ids[fold_text(needle)]]
+                for needle in needles}
+    
+    def positions(self, col, needle):
+        """Positions of the export rows whose col contains needle"""
+        if col not in self.columns or needle not in self.columns[col]:
+            return self.fallback.positions(col, needle)
+        return np.flatnonzero(self.folded_column(col).mask(self.columns[col][needle]))
+    
+    def match_table(self, needle_ids):
+        """DataFrame of (col, needle, position) for every export row matched by a needle of needle_ids
+
+        col is the position of the column in SEARCH_COLUMNS and needle the id given in needle_ids;
+        the (distinct value, needle) hits of each column are joined against the rows holding those values.
+        """
+        frames = []
+        for col_id, col in enumerate(SEARCH_COLUMNS):
+            if col not in self.columns:
+                continue
+            needle_values = [(needle_ids[needle], value_ids) for needle, value_ids in self.columns[col].items()
+                             if needle in needle_ids]
+            hits = pd.DataFrame({
+                'needle': np.fromiter((needle for needle, value_ids in needle_values for _ in value_ids), dtype=np.intp),
+                'value': np.fromiter((value_id for _, value_ids in needle_values for value_id in value_ids),
+                                     dtype=np.intp),
+            })
+            codes = self.folded_column(col).codes
+            rows = pd.DataFrame({'value': codes, 'position': np.arange(len(codes))})
+            frames.append(hits.merge(rows, on='value').assign(col=col_id)[['col', 'needle', 'position']])
+        if not frames:
+            return pd.DataFrame({'col': no_rows(), 'needle': no_rows(), 'position': no_rows()})
+        return pd.concat(frames, ignore_index=True)
+
+def search_needles(product_groups):
+    """Needles each searchable column is queried with by search_positions for these product groups"""
+    column_needles = {col: set(product_groups) for col in SEARCH_COLUMNS}
+    column_needles['Release'].update(release_name for operator_tuples in product_groups.values()
+                                     for _, release_name in operator_tuples if release_name)
+    return column_needles
+
+def no_rows():
+    """An empty array of row positions"""
+    return np.empty(0, dtype=np.intp)
+
+def row_content_ids(df):
+    """Id of each row's values, shared only by rows that drop_duplicates would treat as equal"""
+    content_ids = np.arange(len(df))
+    duplicated = df.duplicated(keep=False).to_numpy()
+    if duplicated.any():
+        groups = df[duplicated].groupby(list(df.columns), sort=False, dropna=False, observed=True).ngroup()
+        content_ids[duplicated] = len(df) + groups.to_numpy()
+    return content_ids
+
+def unique_positions(positions, content_ids):
+    """Drop positions whose row repeats the values of an earlier one, keeping order (like drop_duplicates)"""
+    if len(positions) == 0:
+        return positions
+    _, first = np.unique(content_ids[positions], return_index=True)
+    return positions[np.sort(first)]
+
+def column_positions(df, col, needle, index=None):
+    """Positions of the rows whose col contains needle, case-insensitively; uses the search index when given"""
+    if index is not None:
+        return index.positions(col, needle)
+    return np.flatnonzero(FoldedColumn(df[col]).contains(needle))
+
+def search_positions(df, product_name, release_name=None, index=None, content_ids=None):
+    """Positions of the rows whose Release contains release_name, or else whose searchable columns contain
+    product_name, column by column, with repeated rows dropped"""
     if not product_name:
-        return pd.DataFrame()
+        return no_rows()
     
     # If a specific release name is provided, try searching by that first
     if release_name:
-        release_matches = df[df['Release'].astype(str).str.contains(re.escape(release_name), case=False, na=False)]
-        if not release_matches.empty:
+        release_matches = column_positions(df, 'Release', release_name, index)
+        if len(release_matches):
             return release_matches
     
     # Search by product name across multiple columns
-    search_columns = ['Product', 'Release', 'Release shortname', 'Release ID', 'GA name']
-    matches = pd.DataFrame()
+    col_matches = [column_positions(df, col, product_name, index) for col in SEARCH_COLUMNS if col in df.columns]
+    if not col_matches:
+        return no_rows()
+    if content_ids is None:
+        content_ids = row_content_ids(df)
+    return unique_positions(np.concatenate(col_matches), content_ids)
+
+def filter_release_window(df, positions, start=None, stop=None, index=None):
+    """Filter release positions to GA dates in [start, stop), returned in GA date order"""
+    if len(positions) == 0:
+        return positions
+    if index is not None:
+        return index.date_index().window(positions, start, stop)
+    return positions[DateIndex(df['GA date'].iloc[positions]).window(np.arange(len(positions)), start, stop)]
+
+def filter_by_version(df, positions, product_name, version_map, index=None):
+    """Filter release positions to those matching the version in reference.txt"""
+    if len(positions) == 0 or not version_map or product_name not in version_map:
+        return positions
     
-    for col in search_columns:
-        if col in df.columns:
-            col_matches = df[df[col].astype(str).str.contains(re.escape(product_name), case=False, na=False)]
-            matches = pd.concat([matches, col_matches]).drop_duplicates()
+    target_version = version_map[product_name]
+    if index is not None:
+        return positions[index.version_index().matches(target_version, positions)]
+    return positions[VersionIndex(df.iloc[positions]).matches(target_version)]
+
+class ReportBuilder:
+    """Report lines collected in memory, then written once to each destination"""
+    
+    def __init__(self):
+        self.lines = []
+    
+    def add(self, text):
+        """Append one line (or several, separated by newlines) to the report"""
+        self.lines.append(text)
     
-    return matches
+    def drain(self, destinations):
+        """Write the lines added so far to each open destination in one write, flush it, and start over"""
+        text = '\n'.join(self.lines) + '\n'
+        for destination in destinations:
+            destination.write(text)
+            destination.flush()
+        self.lines = []
+    
+    def write(self, output_file, echo=True, stream=None):
+        """Write the report to output_file ('-' for stream only), echoing it to stream unless echo is False"""
+        if stream is None:
+            stream = sys.stdout
+        text = '\n'.join(self.lines) + '\n'
+        if output_file == STDOUT_OUTPUT:
+            stream.write(text)
+            return
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(text)
+        if echo:
+            stream.write(text)
+
+def group_operators_by_product(operator_product_pairs):
+    """Group (operator, release_name) tuples by product, preserving source.txt order"""
+    product_groups = OrderedDict()
+    for item in operator_product_pairs:
+        if len(item) == 3:
+            operator, product, release_name = item
+        else:
+            operator, product = item[0], item[1]
+            release_name = ""
+        
+        if product:
+            if product not in product_groups:
+                product_groups[product] = []
+            product_groups[product].append((operator, release_name))
+    return product_groups
 
-def filter_future_releases(matches):
-    """Filter releases to only show those with GA dates after today"""
-    if matches.empty:
-        return matches
+class SearchCache:
+    """Memoized search_positions results for one loaded export, keyed on (product, release name)"""
     
-    today = date.today()
-    matches['GA date'] = pd.to_datetime(matches['GA date'])
-    future_matches = matches[matches['GA date'].dt.date > today]
+    def __init__(self, df, index=None):
+        self.df = df
+        self.index = index
+        self.content_ids = row_content_ids(df)
+        self.results = {}
+        self.hits = 0
+        self.misses = 0
     
-    return future_matches
+    def search(self, product, release_name):
+        """search_positions(df, product, release_name), run once per distinct query"""
+        # Every falsy release name searches by product alone
+        key = (product, release_name or '')
+        if key in self.results:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.results[key] = search_positions(self.df, product, release_name, self.index, self.content_ids)
+        return self.results[key]
+
+def search_product_group(df, product, operator_tuples, index=None, cache=None):
+    """Row positions of the union of search_positions results for every operator of a product group"""
+    content_ids = row_content_ids(df) if cache is None else cache.content_ids
+    operator_matches = []
+    merged = set()
+    for operator, release_name in operator_tuples:
+        if cache is None:
+            operator_matches.append(search_positions(df, product, release_name, index, content_ids))
+            continue
+        # A repeated query adds no rows that are not already in the union
+        positions = cache.search(product, release_name)
+        if (release_name or '') not in merged:
+            merged.add(release_name or '')
+            operator_matches.append(positions)
+    if not operator_matches:
+        return no_rows()
+    return unique_positions(np.concatenate(operator_matches), content_ids)
+
+def earliest_release_rows(matches):
+    """Keep the row with the earliest GA date of each release"""
+    return matches.loc[matches.groupby('Release')['GA date'].idxmin()]
 
-def filter_by_version(matches, product_name, version_map):
-    """Filter releases to only show those matching the version in reference.txt"""
-    if matches.empty or not version_map or product_name not in version_map:
-        return matches
+def earliest_release_positions(df, positions, index=None):
+    """Position of the row with the earliest GA date of each release, in release order
+
+    positions are in GA date order (see filter_release_window), so the first row of
+    each release is its earliest, as groupby idxmin would pick it.
+    """
+    if index is not None:
+        codes = index.folded_column('Release').codes[positions]
+    else:
+        codes = pd.factorize(df['Release'].iloc[positions])[0]
+    named = codes >= 0
+    _, first = np.unique(codes[named], return_index=True)
+    earliest = positions[named][first]
+    releases = df['Release'].iloc[earliest].to_numpy(dtype=object)
+    return earliest[np.argsort(releases, kind='stable')]
+
+def select_product_releases(df, positions, product, version_map, show_all=False, index=None,
+                            date_from=None, date_to=None):
+    """Apply the version and date filters and return the earliest GA row of each release"""
+    # Apply version filtering first if available
+    if version_map:
+        positions = filter_by_version(df, positions, product, version_map, index)
     
-    target_version = version_map[product_name]
-    version_matches = matches[matches['Release'].astype(str).str.contains(re.escape(target_version), case=False, na=False)]
+    # Keep the releases in the GA date window (after today unless show_all), in date order
+    start, stop = release_window(show_all, date_from, date_to)
+    positions = filter_release_window(df, positions, start, stop, index)
+    if len(positions) == 0:
+        return pd.DataFrame()
     
-    return version_matches
+    # Get the earliest (future) GA date for each release; rows are only materialized here
+    return df.iloc[earliest_release_positions(df, positions, index)]
 
-def write_to_file_and_print(text, file_handle=None):
-    """Write text to both console and file"""
-    print(text)
-    if file_handle:
-        file_handle.write(text + '\n')
+def find_product_releases(df, product, operator_tuples, version_map, show_all=False, index=None, cache=None,
+                          date_from=None, date_to=None):
+    """Return (candidate row positions, selected releases) for one product group"""
+    positions = search_product_group(df, product, operator_tuples, index, cache)
+    if cache is not None:
+        index = cache.index
+    return positions, select_product_releases(df, positions, product, version_map, show_all, index,
+                                              date_from, date_to)
 
-def format_results_by_product(operator_product_pairs, df, version_map, output_file='results.txt', show_all=False):
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    today = date.today()
+class RecordColumn:
+    """Folded distinct values of one record attribute, each with the positions of its records"""
+    
+    def __init__(self, records, attr):
+        positions = {}
+        for pos, record in enumerate(records):
+            value = getattr(record, attr)
+            if isinstance(value, str):
+                positions.setdefault(value, []).append(pos)
+        self.values = [fold_text(value) for value in positions]
+        self.positions = list(positions.values())
+        self.trigrams = TrigramIndex(self)
+    
+    def containing(self, needle):
+        """Positions of the records whose value contains needle, in record order"""
+        folded = fold_text(needle)
+        candidates = self.trigrams.candidates(needle)
+        if candidates is None:
+            candidates = range(len(self.values))
+        positions = []
+        for value_id in candidates:
+            if folded in self.values[value_id]:
+                positions.extend(self.positions[value_id])
+        return sorted(positions)
+
+class RecordIndex:
+    """Search index for the pure-Python engine, the counterpart of SearchIndex and SearchCache
+
+    Each distinct column value is folded once, records are de-duplicated by content id,
+    and searches are memoized on (product, release name).
+    """
+    
+    def __init__(self, records):
+        self.records = records
+        self.columns = {}
+        self.content_ids = None
+        self.results = {}
+    
+    def column(self, attr):
+        """The RecordColumn of attr, built once per export"""
+        if attr not in self.columns:
+            self.columns[attr] = RecordColumn(self.records, attr)
+        return self.columns[attr]
+    
+    def unique(self, positions):
+        """Drop positions whose record repeats an earlier record's values, keeping order (like drop_duplicates)"""
+        if self.content_ids is None:
+            ids = {}
+            self.content_ids = [ids.setdefault(record.key(), len(ids)) for record in self.records]
+        seen = set()
+        unique = []
+        for pos in positions:
+            content_id = self.content_ids[pos]
+            if content_id not in seen:
+                seen.add(content_id)
+                unique.append(pos)
+        return unique
+    
+    def search(self, product, release_name):
+        """python_search_by_product(self, product, release_name), run once per distinct query"""
+        # Every falsy release name searches by product alone
+        key = (product, release_name or '')
+        if key not in self.results:
+            self.results[key] = python_search_by_product(self, product, release_name)
+        return self.results[key]
+
+def python_search_by_product(index, product_name, release_name=None):
+    """search_positions for the pure-Python engine, as record positions"""
+    if not product_name:
+        return []
+    
+    if release_name:
+        release_matches = index.column('release').containing(release_name)
+        if release_matches:
+            return release_matches
+    
+    matches = []
+    for col in SEARCH_COLUMNS:
+        matches.extend(index.column(COLUMN_KEYS[col]).containing(product_name))
+    return index.unique(matches)
+
+def python_earliest_release_rows(matches):
+    """earliest_release_rows for the pure-Python engine, in release order like groupby"""
+    earliest = {}
+    for record in matches:
+        if not isinstance(record.release, str) or record.ga_date is MISSING:
+            continue
+        current = earliest.get(record.release)
+        if current is None or record.ga_date < current.ga_date:
+            earliest[record.release] = record
+    return [earliest[release] for release in sorted(earliest)]
+
+def iter_python_product_results(records, product_groups, version_map, show_all=False, date_from=None, date_to=None):
+    """Yield (product, releases) per product group with the pure-Python engine, searching each one when reached"""
+    start, stop = (datetime.combine(day, datetime.min.time()) if day else None
+                   for day in release_window(show_all, date_from, date_to))
+    index = RecordIndex(records)
+    for product, operator_tuples in product_groups.items():
+        positions = []
+        for operator, release_name in operator_tuples:
+            positions.extend(index.search(product, release_name))
+        matches = [records[pos] for pos in index.unique(positions)]
+        
+        if version_map and product in version_map:
+            matches = python_filter_by_version(matches, version_map[product])
+        if start or stop:
+            matches = [record for record in matches if record.ga_date is not MISSING
+                       and (start is None or record.ga_date >= start) and (stop is None or record.ga_date < stop)]
+        yield product, python_earliest_release_rows(matches)
+
+def release_ids(df):
+    """Release ID of every row, with NO_RELEASE_ID standing in for rows that have none"""
+    if 'Release ID' not in df.columns:
+        return pd.Series(NO_RELEASE_ID, index=df.index, dtype=object)
+    return df['Release ID'].astype(object).where(df['Release ID'].notna(), NO_RELEASE_ID)
+
+def release_fingerprints(df):
+    """Map each Release ID to a fingerprint of all of its rows"""
+    columns = [col for col in EXPORT_COLUMNS if col in df.columns]
+    row_hashes = pd.util.hash_pandas_object(df[columns], index=False)
+    # uint64 sums wrap around, giving an order-independent combination of the row hashes
+    return {str(release_id): int(value) for release_id, value in row_hashes.groupby(release_ids(df).values).sum().items()}
+
+def load_delta_state(state_file, engine='pandas'):
+    """Return (metadata, cached result rows) from a previous --delta run, or (None, None)"""
+    if not os.path.exists(state_file):
+        return None, None
+    metadata = read_cache_key(state_file)
+    if not metadata or metadata.get('version') != CACHE_FORMAT_VERSION:
+        return None, None
+    try:
+        return metadata, read_cache_file(state_file, engine)
+    except Exception:
+        return None, None
+
+def product_group_hits(rows, product, operator_tuples):
+    """True if any of a product group's release-name or product searches matches one of rows"""
+    if rows.empty:
+        return False
+    release_values = FoldedColumn(rows['Release'])
+    for release_name in set(release_name for _, release_name in operator_tuples if release_name):
+        if release_values.value_ids(release_name):
+            return True
+    for col in SEARCH_COLUMNS:
+        if col in rows.columns and FoldedColumn(rows[col]).value_ids(product):
+            return True
+    return False
+
+def save_delta_state(state_file, product_results, columns, settings, fingerprints, groups):
+    """Store per-product result rows and the fingerprints they were computed from"""
+    result_frames = [releases.assign(_product=product) for product, releases in product_results.items()
+                     if not releases.empty]
+    if result_frames:
+        result_rows = restore_export_dtypes(pd.concat(result_frames, ignore_index=True))
+    else:
+        result_rows = pd.DataFrame(columns=[col for col in EXPORT_COLUMNS if col in columns] + ['_product'])
+    metadata = {'version': CACHE_FORMAT_VERSION, 'settings': settings, 'fingerprints': fingerprints, 'groups': groups}
+    try:
+        write_cache_file(result_rows, state_file, metadata)
+    except Exception as e:
+        print(f"Warning: delta state not written: {e}")
+
+def iter_product_results_delta(df, product_groups, version_map, show_all=False, state_file=DELTA_STATE_FILE,
+                               engine='pandas', date_from=None, date_to=None):
+    """Yield (product, releases) per product group, re-searching only product groups whose candidate rows changed
+
+    The delta state is saved once every product group has been yielded.
+    """
+    start = time.perf_counter()
+    fingerprints = release_fingerprints(df)
+    settings = {'today': str(date.today()), 'show_all': show_all,
+                'from': str(date_from) if date_from else None, 'to': str(date_to) if date_to else None}
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        header = f"OpenShift Day 2 Operator Search Results - Conan Tool"
-        write_to_file_and_print(header, f)
-        write_to_file_and_print(f"Generated: {timestamp}", f)
-        if show_all:
-            write_to_file_and_print(f"Filter: Showing all releases (including past and future)", f)
+    metadata, cached_rows = load_delta_state(state_file, engine)
+    if metadata is not None and metadata.get('settings') == settings:
+        previous = metadata['fingerprints']
+        changed_ids = {release_id for release_id in set(previous) | set(fingerprints)
+                       if previous.get(release_id) != fingerprints.get(release_id)}
+        changed_rows = df[release_ids(df).isin(changed_ids)]
+        previous_groups = metadata['groups']
+    else:
+        changed_ids = None
+        previous_groups = {}
+    
+    product_results = OrderedDict()
+    groups = {}
+    recomputed = 0
+    search_cache = SearchCache(df, SearchIndex(df))
+    row_release_ids = release_ids(df)
+    for product, operator_tuples in product_groups.items():
+        signature = json.dumps([operator_tuples, version_map.get(product)])
+        previous_group = previous_groups.get(product)
+        
+        # A cached section is still valid when no changed release was among its candidates
+        # and none of the changed rows matches one of its searches
+        reuse = (
+            changed_ids is not None
+            and previous_group is not None
+            and previous_group['signature'] == signature
+            and not changed_ids.intersection(previous_group['candidate_ids'])
+            and not product_group_hits(changed_rows, product, operator_tuples)
+        )
+        if reuse:
+            releases = cached_rows[cached_rows['_product'] == product].drop(columns='_product')
+            candidate_ids = previous_group['candidate_ids']
         else:
-            write_to_file_and_print(f"Filter: Only showing releases with GA dates after {today}", f)
-        if version_map:
-            write_to_file_and_print(f"Version Filter: {', '.join([f'{k}: {v}' for k, v in version_map.items()])}", f)
-        write_to_file_and_print("="*80, f)
-        write_to_file_and_print("Search Results by Product/Release Mapping (Source.txt Order):", f)
-        write_to_file_and_print("="*80, f)
-        
-        # Group operators by product while preserving order
-        product_groups = OrderedDict()
-        for item in operator_product_pairs:
-            if len(item) == 3:
-                operator, product, release_name = item
-            else:
-                operator, product = item[0], item[1]
-                release_name = ""
-            
-            if product:
-                if product not in product_groups:
-                    product_groups[product] = []
-                product_groups[product].append((operator, release_name))
+            positions, releases = find_product_releases(df, product, operator_tuples, version_map, show_all,
+                                                        cache=search_cache, date_from=date_from, date_to=date_to)
+            candidate_ids = sorted(set(row_release_ids.iloc[positions]))
+            recomputed += 1
         
-        # Track operators with and without answers
-        operators_with_answers = []
-        operators_without_answers = []
+        product_results[product] = releases
+        groups[product] = {'signature': signature, 'candidate_ids': candidate_ids}
+        yield product, releases
+    
+    # Nothing changed: the stored state is already up to date
+    if recomputed or changed_ids or set(groups) != set(previous_groups):
+        save_delta_state(state_file, product_results, df.columns, settings, fingerprints, groups)
+    
+    elapsed = time.perf_counter() - start
+    changed = 'all' if changed_ids is None else len(changed_ids)
+    print(f"Delta: {changed} changed release(s), re-searched {recomputed} of {len(product_groups)} "
+          f"product group(s) in {elapsed:.3f}s (search cache: {search_cache.hits} hit(s), "
+          f"{search_cache.misses} miss(es))")
+
+def join_candidates(product_groups, index, content_ids):
+    """DataFrame of (group, position) for the candidate rows of every product group, in search_product_group order"""
+    queries = pd.DataFrame(
+        [(group, product, release_name or '') for group, (product, operator_tuples) in enumerate(product_groups.items())
+         for _, release_name in operator_tuples],
+        columns=['group', 'product', 'release_name'])
+    # A repeated query adds no rows that are not already in its group's union
+    queries = queries.drop_duplicates(['group', 'release_name'], ignore_index=True)
+    queries['query'] = np.arange(len(queries))
+    # Products and release names are joined on as integer needle ids
+    needle_ids = {needle: needle_id for needle_id, needle in
+                  enumerate(dict.fromkeys(queries['product'].tolist() + queries['release_name'].tolist()))}
+    queries['product'] = queries['product'].map(needle_ids)
+    queries['release_name'] = queries['release_name'].map(needle_ids)
+    
+    # Release-name matches take priority; queries without any fall back to the product searches
+    matches = index.match_table(needle_ids)
+    release_hits = queries[queries['release_name'] != needle_ids.get('')].merge(
+        matches[matches['col'] == SEARCH_COLUMNS.index('Release')], left_on='release_name', right_on='needle')
+    product_hits = queries[~queries['query'].isin(release_hits['query'])].merge(
+        matches, left_on='product', right_on='needle')
+    candidates = pd.concat([release_hits, product_hits], ignore_index=True)
+    candidates = candidates.sort_values(['query', 'col', 'position'], ignore_index=True)
+    
+    # Rows with identical values count once per group, where they are first matched
+    candidates['content'] = content_ids[candidates['position'].to_numpy()]
+    return candidates.drop_duplicates(['group', 'content'], ignore_index=True)[['group', 'position']]
+
+def join_version_filter(candidates, products, version_map, versions):
+    """Keep the candidates passing their group's version filters, with one grouped operation per distinct filter"""
+    groups = candidates['group'].to_numpy()
+    positions = candidates['position'].to_numpy()
+    keep = ~np.isin(groups, [group for group, product in enumerate(products) if product in version_map])
+    for spec in dict.fromkeys(spec for product in products for spec in version_map.get(product, [])):
+        in_groups = np.isin(groups, [group for group, product in enumerate(products)
+                                     if spec in version_map.get(product, [])])
+        kind, value = parse_version_spec(spec)
+        if kind == 'latest':
+            # The newest n distinct minor versions among each group's candidates
+            has_version = versions.major[positions] >= 0
+            minors = pd.DataFrame({'group': groups, 'minor': versions.minor_key[positions]})[in_groups & has_version]
+            newest = minors.groupby('group')['minor'].rank(method='dense', ascending=False) <= value
+            passes = np.zeros(len(groups), dtype=bool)
+            passes[minors.index[newest.to_numpy()]] = True
+        else:
+            passes = versions.matches([spec], positions)
+        keep |= in_groups & passes
+    return candidates[keep]
+
+def join_product_results(df, product_groups, version_map, show_all=False, date_from=None, date_to=None):
+    """Compute per-product results for all product groups at once, joining them against the export's match table"""
+    products = list(product_groups)
+    index = MultiPatternIndex(df, search_needles(product_groups))
+    candidates = join_candidates(product_groups, index, row_content_ids(df))
+    if version_map:
+        candidates = join_version_filter(candidates, products, version_map, index.version_index())
+    
+    # Release codes in sorted name order, so the release order of groupby falls out of a sort
+    release_codes = pd.factorize(df['Release'], sort=True)[0]
+    dates = index.date_index()
+    positions = candidates['position'].to_numpy()
+    candidates = candidates.assign(rank=dates.ranks[positions], release=release_codes[positions],
+                                   order=np.arange(len(candidates)))
+    
+    # The GA date window, then the earliest row of each release of each group
+    low, high = dates.bounds(*release_window(show_all, date_from, date_to))
+    candidates = candidates[(candidates['rank'] >= low) & (candidates['rank'] < high) & (candidates['release'] >= 0)]
+    earliest = candidates.sort_values(['group', 'rank', 'order']).drop_duplicates(['group', 'release'])
+    earliest = earliest.sort_values(['group', 'release'])
+    
+    product_results = OrderedDict((product, pd.DataFrame()) for product in products)
+    for group, group_positions in earliest.groupby('group')['position']:
+        product_results[products[group]] = df.iloc[group_positions.to_numpy()]
+    return product_results
+
+def sql_contains(value, needle):
+    """SQLite function giving the same case-insensitive substring test as the pandas searches"""
+    if value is None or needle is None:
+        return 0
+    return 1 if fold_text(needle) in fold_text(value) else 0
+
+class ReleaseDB(sqlite3.Connection):
+    """SQLite connection to the release database, remembering whether the trigram index exists"""
+    has_fts = False
+
+def connect_release_db(db_file):
+    """Open the release database, creating the schema and full-text index if needed"""
+    conn = sqlite3.connect(db_file, factory=ReleaseDB)
+    conn.create_function('conan_contains', 2, sql_contains, deterministic=True)
+    version_columns = [column[1] for column in conn.execute("PRAGMA table_info(versions)")]
+    if version_columns and 'row_id' not in version_columns:
+        # The per-release versions table of older databases
+        conn.execute("DROP TABLE versions")
+    conn.executescript(RELEASE_DB_SCHEMA)
+    if conn.execute("PRAGMA user_version").fetchone()[0] < RELEASE_DB_VERSION:
+        # Databases imported without the per-row versions table, or under older version rules, are parsed again
+        with conn:
+            conn.execute("DELETE FROM versions")
+            store_release_versions(conn)
+        conn.execute(f"PRAGMA user_version = {RELEASE_DB_VERSION}")
+    has_flags = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'releases_non_ascii'").fetchone() is not None
+    try:
+        conn.executescript(RELEASE_DB_FTS_SCHEMA)
+    except sqlite3.OperationalError:
+        # SQLite without FTS5 trigram support: searches fall back to scanning the table
+        pass
+    conn.has_fts = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'releases_fts'"
+    ).fetchone() is not None
+    if conn.has_fts and not has_flags:
+        # Databases imported before the flag table existed are flagged once
+        with conn:
+            flag_non_ascii_rows(conn)
+    return conn
+
+def store_release_versions(conn, after_row_id=0):
+    """Parse the version of every row after after_row_id into the versions table; rows without one get no entry"""
+    rows = conn.execute("SELECT row_id, release, release_shortname FROM releases WHERE row_id > ?", (after_row_id,))
+    versions = ((row_id, row_version(release, release_shortname)) for row_id, release, release_shortname in rows)
+    conn.executemany(
+        "INSERT OR REPLACE INTO versions VALUES (?, ?, ?, ?, ?, ?)",
+        [(row_id, version[0], version[1], version[2] if len(version) == 3 else None,
+          version_key(version[:2]), version_key((version + (-1,))[:3])) for row_id, version in versions if version]
+    )
+
+def flag_non_ascii_rows(conn, after_row_id=0):
+    """Record the rows whose searchable columns hold non-ASCII text, which the trigram index cannot fold"""
+    non_ascii = ' OR '.join(f"{COLUMN_KEYS[col]} GLOB '*[^ -~]*'" for col in SEARCH_COLUMNS)
+    conn.execute(f"INSERT OR IGNORE INTO releases_non_ascii SELECT row_id FROM releases WHERE row_id > ? AND ({non_ascii})",
+                 (after_row_id,))
+
+def import_to_sqlite(df, db_file, source):
+    """Load an export into the release database; imported Release IDs replace the rows already stored"""
+    conn = connect_release_db(db_file)
+    columns = list(COLUMN_KEYS.values())
+    rows = pd.DataFrame({COLUMN_KEYS[col]: df[col] if col in df.columns else None for col in EXPORT_COLUMNS})
+    rows['ga_date'] = df['GA date'].dt.strftime(SQL_DATETIME_FORMAT)
+    rows = rows.astype(object).where(rows.notna(), None)
+    
+    with conn:
+        conn.execute("CREATE TEMP TABLE import_ids (release_id TEXT PRIMARY KEY)")
+        conn.executemany("INSERT OR IGNORE INTO import_ids VALUES (?)",
+                         ((release_id,) for release_id in rows['release_id'].dropna().unique()))
+        conn.execute("DELETE FROM releases WHERE release_id IN (SELECT release_id FROM import_ids)")
+        conn.execute("DROP TABLE import_ids")
         
-        products_with_releases = []
-        products_without_releases = []
+        last_row_id = conn.execute("SELECT COALESCE(MAX(row_id), 0) FROM releases").fetchone()[0]
+        conn.executemany(
+            f"INSERT INTO releases ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            rows[columns].itertuples(index=False, name=None)
+        )
+        store_release_versions(conn, last_row_id)
+        if conn.has_fts:
+            flag_non_ascii_rows(conn, last_row_id)
+        # Rows without a Release ID cannot be keyed; drop exact repeats, keeping the newest copy
+        conn.execute(f"""
+            DELETE FROM releases WHERE release_id IS NULL AND row_id NOT IN (
+                SELECT MAX(row_id) FROM releases WHERE release_id IS NULL GROUP BY {', '.join(columns)}
+            )
+        """)
         
-        for product, operator_tuples in product_groups.items():
-            all_matches = pd.DataFrame()
-            operators_list = []
-            
-            for operator, release_name in operator_tuples:
-                operators_list.append(operator)
-                operator_matches = search_by_product(df, product, release_name)
-                if not operator_matches.empty:
-                    all_matches = pd.concat([all_matches, operator_matches]).drop_duplicates()
-            
-            matches = all_matches
-            operators = operators_list
-            
-            if not matches.empty:
-                # Apply version filtering first if available
-                if version_map:
-                    matches = filter_by_version(matches, product, version_map)
-                
-                if not matches.empty:
-                    # Create a copy to avoid SettingWithCopyWarning
-                    matches = matches.copy()
-                    matches['GA date'] = pd.to_datetime(matches['GA date'])
-                    
-                    if show_all:
-                        # Get the earliest GA date for each release
-                        future_matches = matches.loc[matches.groupby('Release')['GA date'].idxmin()]
-                    else:
-                        # Filter for future releases first
-                        future_only = filter_future_releases(matches)
-                        
-                        if not future_only.empty:
-                            # Get the earliest future GA date for each release
-                            future_matches = future_only.loc[future_only.groupby('Release')['GA date'].idxmin()]
-                        else:
-                            future_matches = pd.DataFrame()
-                    
-                    if not future_matches.empty:
-                        products_with_releases.append((product, operators, future_matches))
-                        operators_with_answers.extend(operators)
-                    else:
-                        products_without_releases.append((product, operators))
-                        operators_without_answers.extend(operators)
-                else:
-                    products_without_releases.append((product, operators))
-                    operators_without_answers.extend(operators)
-            else:
-                products_without_releases.append((product, operators))
-                operators_without_answers.extend(operators)
-        
-        # Add unmapped operators to those without answers
-        unmapped_operators = []
-        for item in operator_product_pairs:
-            if len(item) == 3:
-                operator, product, release_name = item
-            else:
-                operator, product = item[0], item[1]
-            if not product:
-                unmapped_operators.append(operator)
-        operators_without_answers.extend(unmapped_operators)
-        
-        if products_with_releases:
-            if show_all:
-                section_header = "\nPRODUCTS WITH RELEASES FOUND"
-            else:
-                section_header = "\nPRODUCTS WITH FUTURE RELEASES FOUND"
-            write_to_file_and_print(section_header, f)
-            write_to_file_and_print("="*80, f)
-            
-            for i, (product, operators, matches_first) in enumerate(products_with_releases, 1):
-                write_to_file_and_print(f"\nProduct {i}: {product}", f)
-                write_to_file_and_print(f"Operators: {', '.join(operators)}", f)
-                write_to_file_and_print("-" * 60, f)
-                
-                # Sort releases by GA date and take only the 2 closest
-                matches_sorted = matches_first.sort_values('GA date')
-                closest_2_releases = matches_sorted.head(2)
-                
-                if show_all:
-                    write_to_file_and_print(f"Found {len(matches_first)} release(s):", f)
+        conn.execute("INSERT INTO imports (source, imported_at, records) VALUES (?, ?, ?)",
+                     (os.path.abspath(source), datetime.now().strftime(SQL_DATETIME_FORMAT), len(rows)))
+    
+    total = conn.execute("SELECT COUNT(*) FROM releases").fetchone()[0]
+    imports = conn.execute("SELECT COUNT(*) FROM imports").fetchone()[0]
+    conn.close()
+    return total, imports
+
+def sqlite_match_clause(conn, column, needle):
+    """WHERE clause matching rows whose column contains needle, narrowed through the trigram index"""
+    folded = fold_text(needle)
+    if conn.has_fts and len(folded) >= 3 and folded.isascii():
+        # The index folds ASCII case only, so rows flagged at import as holding other characters are always checked
+        phrase = '"' + folded.replace('"', '""') + '"'
+        return (f"row_id IN (SELECT rowid FROM releases_fts WHERE releases_fts MATCH ? "
+                f"UNION ALL SELECT row_id FROM releases_non_ascii) AND conan_contains({column}, ?)",
+                [f"{column} : {phrase}", needle])
+    return f"conan_contains({column}, ?)", [needle]
+
+def sqlite_query_releases(conn, row_ids, conditions=(), params=()):
+    """Fetch the rows of row_ids that meet every condition, in row_ids order, as a DataFrame with the export's column names
+
+    Conditions can use the versions columns, which are NULL for rows without a version.
+    """
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS candidates (position INTEGER PRIMARY KEY, row_id INTEGER)")
+    conn.execute("DELETE FROM candidates")
+    conn.executemany("INSERT INTO candidates (row_id) VALUES (?)", ((row_id,) for row_id in row_ids))
+    select = ', '.join(f'{sql_col} AS "{col}"' for col, sql_col in COLUMN_KEYS.items())
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+    df = pd.read_sql_query(f"SELECT row_id, {select} FROM candidates JOIN releases USING (row_id) "
+                           f"LEFT JOIN versions USING (row_id) {where} ORDER BY position",
+                           conn, params=list(params), index_col='row_id')
+    df.index.name = None
+    df['GA date'] = pd.to_datetime(df['GA date'], format=SQL_DATETIME_FORMAT)
+    return missing_as_nan(df)
+
+def sqlite_match_row_ids(conn, column, needle):
+    """Row ids of the rows whose column contains needle, in row id order"""
+    where, params = sqlite_match_clause(conn, column, needle)
+    return [row_id for row_id, in conn.execute(f"SELECT row_id FROM releases WHERE {where} ORDER BY row_id", params)]
+
+def sqlite_search_by_product(conn, product_name, release_name=None):
+    """search_positions against the release database, as row ids in the order of its result"""
+    if not product_name:
+        return []
+    
+    # Release-name matches take priority, as in search_positions
+    if release_name:
+        release_matches = sqlite_match_row_ids(conn, 'release', release_name)
+        if release_matches:
+            return release_matches
+    
+    row_ids = []
+    for col in SEARCH_COLUMNS:
+        row_ids.extend(sqlite_match_row_ids(conn, COLUMN_KEYS[col], product_name))
+    return list(OrderedDict.fromkeys(row_ids))
+
+def sqlite_version_condition(specs):
+    """WHERE condition for the rows whose version passes any of specs, answered from the versions table"""
+    alternatives, params = [], []
+    for kind, value in (parse_version_spec(spec) for spec in specs):
+        if kind == 'latest':
+            # The newest n minors among all of the product's candidates, before the date window
+            alternatives.append("minor_key IN (SELECT DISTINCT minor_key FROM candidates JOIN versions USING (row_id) "
+                                "ORDER BY minor_key DESC LIMIT ?)")
+            params.append(value)
+        else:
+            alternatives.append(' AND '.join(f"{'minor_key' if len(bound) == 2 else 'patch_key'} "
+                                             f"{SQL_COMPARISONS[comparison]} ?" for comparison, bound in value))
+            params.extend(version_key(bound) for _, bound in value)
+    return '(' + ' OR '.join(f'({alternative})' for alternative in alternatives) + ')', params
+
+class ReleaseDBSearchCache:
+    """Memoized sqlite_search_by_product row ids for one release database, keyed on (product, release name)"""
+    
+    def __init__(self, conn):
+        self.conn = conn
+        self.results = {}
+    
+    def search(self, product, release_name):
+        """sqlite_search_by_product(conn, product, release_name), run once per distinct query"""
+        # Every falsy release name searches by product alone
+        key = (product, release_name or '')
+        if key not in self.results:
+            self.results[key] = sqlite_search_by_product(self.conn, product, release_name)
+        return self.results[key]
+
+def iter_sqlite_product_results(conn, product_groups, version_map, show_all=False, date_from=None, date_to=None):
+    """Yield (product, releases) per product group from the release database, querying each one when reached"""
+    # The GA date window, as bounds the ga_date index can use
+    after, before = (datetime.combine(day, datetime.min.time()).strftime(SQL_DATETIME_FORMAT) if day else None
+                     for day in release_window(show_all, date_from, date_to))
+    cache = ReleaseDBSearchCache(conn)
+    for product, operator_tuples in product_groups.items():
+        # Operator searches are merged as row ids; the rows are fetched once per product
+        row_ids = list(OrderedDict.fromkeys(row_id for _, release_name in operator_tuples
+                                            for row_id in cache.search(product, release_name)))
+        conditions, params = [], []
+        if version_map and product in version_map:
+            condition, condition_params = sqlite_version_condition(version_map[product])
+            conditions.append(condition)
+            params.extend(condition_params)
+        if after:
+            conditions.append("ga_date >= ?")
+            params.append(after)
+        if before:
+            conditions.append("ga_date < ?")
+            params.append(before)
+        all_matches = sqlite_query_releases(conn, row_ids, conditions, params) if row_ids else pd.DataFrame()
+        yield product, earliest_release_rows(all_matches) if not all_matches.empty else pd.DataFrame()
+
+def load_release_db(db_file):
+    """Open an existing release database for --backend sqlite"""
+    if not os.path.exists(db_file):
+        print(f"Error: {db_file} not found, run the import command first")
+        return None
+    conn = connect_release_db(db_file)
+    total = conn.execute("SELECT COUNT(*) FROM releases").fetchone()[0]
+    imports = conn.execute("SELECT COUNT(*) FROM imports").fetchone()[0]
+    print(f"Using database: {db_file} ({total} records from {imports} import(s))")
+    return conn
+
+def import_main(argv):
+    """Entry point of the import command"""
+    args = parse_import_arguments(argv)
+    df = load_csv_data(args.csv_file, use_cache=not args.no_cache, engine=args.csv_engine)
+    if df is None:
+        return
+    source = args.csv_file or find_csv_file()
+    try:
+        total, imports = import_to_sqlite(df, args.db_file, source)
+    except Exception as e:
+        print(f"Error: {e}")
+        return
+    print(f"Imported {len(df)} records from {source} into {args.db_file} ({total} records, {imports} import(s))")
+
+def is_result_snapshot(path):
+    """True if path holds results written with --format, False if it is a Product Pages export"""
+    if path.endswith(('.json', '.ndjson', '.parquet')):
+        return True
+    if not path.endswith('.csv'):
+        return False
+    with open(path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+        header = next(csv.reader(f), [])
+    return 'product' in header and 'operators' in header
+
+def read_result_snapshot(path):
+    """(product, Release, GA date) rows of a result snapshot written with --format, which must hold every found release"""
+    columns = ['product', 'Release', 'GA date', 'found']
+    if path.endswith('.parquet'):
+        rows = pd.read_parquet(path, columns=columns)
+        # GA date is stored as a date there
+        rows['GA date'] = pd.to_datetime(rows['GA date'])
+    else:
+        if path.endswith('.csv'):
+            rows = pd.read_csv(path, usecols=columns, dtype={'product': str, 'Release': str, 'GA date': str},
+                               keep_default_na=False, na_values=[''])
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                if path.endswith('.ndjson'):
+                    records = [json.loads(line) for line in f if line.strip()]
                 else:
-                    write_to_file_and_print(f"Found {len(matches_first)} future release(s):", f)
-                for _, row in closest_2_releases.iterrows():
-                    write_to_file_and_print(f"  BU: {row['BU']}", f)
-                    write_to_file_and_print(f"  Release: {row['Release']}", f)
-                    write_to_file_and_print(f"  GA date: {row['GA date'].strftime('%Y-%m-%d')}", f)
-                    write_to_file_and_print(f"  GA name: {row['GA name']}", f)
-                    maintainer = row.get('Maintainers', '')
-                    if pd.isna(maintainer) or maintainer == '':
-                        maintainer = 'N/A'
-                    write_to_file_and_print(f"  Maintainer: {maintainer}", f)
-                    write_to_file_and_print(f"  Link: {row['Link']}", f)
-                    write_to_file_and_print(f"  Product: {row['Product']}", f)
-                    write_to_file_and_print("  " + "-" * 40, f)
-        
-        if products_without_releases:
-            if show_all:
-                section_header = "\nPRODUCTS WITH NO RELEASES"
-                status_msg = "No releases found"
+                    records = json.load(f)['products']
+            rows = pd.DataFrame([(record['product'], release['Release'], release['GA date'], record['found'])
+                                 for record in records for release in record['releases']], columns=columns)
+        rows['GA date'] = pd.to_datetime(rows['GA date'], format=GA_DATE_FORMAT)
+    
+    # A product with more releases found than written was cut to its --top closest releases,
+    # and the releases left out would show up as removed or added
+    written = rows['Release'].notna().groupby(rows['product'], sort=False).sum()
+    if (rows.groupby('product', sort=False)['found'].first() > written).any():
+        raise ValueError("the snapshot holds only the --top closest releases of some products, "
+                         "write it with --top all to compare it")
+    return rows[['product', 'Release', 'GA date']]
+
+def load_release_dates(path, use_cache=True, engine='pandas', start=None, stop=None):
+    """Earliest GA date of each (product, Release) of a result snapshot or export, or None if it cannot be read
+
+    Export rows are limited to the GA date window [start, stop) first, so each release gets the
+    date the report would show; snapshots were already written with their run's window.
+    """
+    try:
+        if is_result_snapshot(path):
+            rows = read_result_snapshot(path)
+        else:
+            df = load_csv_data(path, use_cache=use_cache, engine=engine)
+            if df is None:
+                return None
+            rows = pd.DataFrame({'product': df['Product'].astype(object), 'Release': df['Release'].astype(object),
+                                 'GA date': df['GA date']})
+            if start:
+                rows = rows[rows['GA date'] >= pd.Timestamp(start)]
+            if stop:
+                rows = rows[rows['GA date'] < pd.Timestamp(stop)]
+    except Exception as e:
+        print(f"Error reading {path}: {e}")
+        return None
+    rows = rows.dropna()
+    return rows.groupby(['product', 'Release'], sort=False)['GA date'].min().reset_index()
+
+def diff_release_dates(old, new):
+    """(added, removed, shifted) releases between two (product, Release, GA date) tables, matched by a hash join"""
+    joined = old.merge(new, on=['product', 'Release'], how='outer', suffixes=(' old', ' new'), indicator=True)
+    added = joined[joined['_merge'] == 'right_only']
+    removed = joined[joined['_merge'] == 'left_only']
+    shifted = joined[(joined['_merge'] == 'both') & (joined['GA date old'] != joined['GA date new'])]
+    shifted = shifted.assign(days=(shifted['GA date new'] - shifted['GA date old']).dt.days)
+    return (added.sort_values(['product', 'Release']), removed.sort_values(['product', 'Release']),
+            shifted.sort_values(['product', 'Release']))
+
+def diff_main(argv):
+    """Entry point of the diff command"""
+    args = parse_diff_arguments(argv)
+    for path in (args.old, args.new):
+        if not os.path.exists(path):
+            print(f"Error: {path} not found")
+            return
+    # Snapshots name products as in source.txt, exports by their Product column, so the two never line up
+    if is_result_snapshot(args.old) != is_result_snapshot(args.new):
+        print(f"Error: cannot compare a result snapshot with an export ({args.old}, {args.new}), "
+              f"pass two snapshots or two exports")
+        return
+    start, stop = release_window(args.show_all, args.date_from, args.date_to)
+    dates = []
+    for path in (args.old, args.new):
+        release_dates = load_release_dates(path, not args.no_cache, args.csv_engine, start, stop)
+        if release_dates is None:
+            return
+        dates.append(release_dates)
+    added, removed, shifted = diff_release_dates(*dates)
+    
+    report = ReportBuilder()
+    report.add(f"Release differences: {args.old} -> {args.new}")
+    report.add("="*80)
+    report.add(f"Added releases: {len(added)}")
+    for product, release, ga_date in zip(added['product'], added['Release'], added['GA date new']):
+        report.add(f"  + {product}: {release} (GA {ga_date.strftime(GA_DATE_FORMAT)})")
+    report.add(f"Removed releases: {len(removed)}")
+    for product, release, ga_date in zip(removed['product'], removed['Release'], removed['GA date old']):
+        report.add(f"  - {product}: {release} (GA {ga_date.strftime(GA_DATE_FORMAT)})")
+    report.add(f"GA date changes: {len(shifted)}")
+    for product, release, old_date, new_date, days in zip(shifted['product'], shifted['Release'],
+                                                         shifted['GA date old'], shifted['GA date new'],
+                                                         shifted['days']):
+        report.add(f"  ~ {product}: {release}: {old_date.strftime(GA_DATE_FORMAT)} -> "
+                   f"{new_date.strftime(GA_DATE_FORMAT)} ({days:+d} days)")
+    report.write(args.output_file)
+    if args.output_file != STDOUT_OUTPUT:
+        print(f"\nDifferences exported to: {args.output_file}")
+
+def is_missing(value):
+    """pd.isna for a single value, without importing pandas for the pure-Python engine"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return True
+    # NaT and NA only exist once pandas has really been imported; 'pandas' itself is in
+    # sys.modules from startup as the lazy module, so check for one of its submodules
+    return 'pandas.core' in sys.modules and not isinstance(value, str) and bool(pd.isna(value))
+
+def earliest_positions(dates, names, count=None):
+    """Positions of the count earliest dates (all if None), by date then name, without sorting every date
+
+    Releases sharing a GA date are ordered by release name; missing dates come last.
+    """
+    chosen = np.arange(len(dates))
+    if count is not None and count < len(dates):
+        # Only the dates up to the count-th earliest are sorted, ties with it included
+        kth = np.partition(dates, count - 1)[count - 1]
+        if not np.isnat(kth):
+            chosen = np.flatnonzero(dates <= kth)
+    order = chosen[np.lexsort((names[chosen], dates[chosen]))]
+    return order if count is None else order[:count]
+
+def closest_releases(releases, count=None):
+    """The count releases (all if None) with the earliest GA dates, in GA date then release name order"""
+    if isinstance(releases, list):
+        if count is None:
+            return sorted(releases, key=lambda record: (record.ga_date, record.release))
+        return heapq.nsmallest(count, releases, key=lambda record: (record.ga_date, record.release))
+    names = releases['Release'].to_numpy(dtype=object)
+    return releases.iloc[earliest_positions(releases['GA date'].to_numpy(), names, count)]
+
+def iter_release_rows(releases):
+    """Iterate over release rows (dicts of a DataFrame's rows, or ReleaseRecords)"""
+    if isinstance(releases, list):
+        return iter(releases)
+    return iter(releases.to_dict('records'))
+
+def format_release_blocks(releases):
+    """Report block of each release (DataFrame or ReleaseRecords), with each field formatted column-wise"""
+    if isinstance(releases, list):
+        columns = [[record[col] for record in releases] for col in RELEASE_BLOCK_COLUMNS]
+        columns[2] = [ga_date.strftime(GA_DATE_FORMAT) for ga_date in columns[2]]
+        columns[4] = ['N/A' if is_missing(maintainer) or maintainer == '' else maintainer
+                      for maintainer in columns[4]]
+    else:
+        columns = []
+        for col in RELEASE_BLOCK_COLUMNS:
+            if col == 'GA date':
+                values = releases[col].dt.strftime(GA_DATE_FORMAT)
+            elif col == 'Maintainers':
+                if col not in releases.columns:
+                    columns.append(['N/A'] * len(releases))
+                    continue
+                values = releases[col].astype(object)
+                values = values.where(values.notna() & (values != ''), 'N/A')
             else:
-                section_header = "\nPRODUCTS WITH NO FUTURE RELEASES"
-                status_msg = f"No future releases found (after {today})"
-            write_to_file_and_print(section_header, f)
-            write_to_file_and_print("="*80, f)
-            
-            for i, (product, operators) in enumerate(products_without_releases, 1):
-                write_to_file_and_print(f"\nProduct {i}: {product}", f)
-                write_to_file_and_print(f"Operators: {', '.join(operators)}", f)
-                write_to_file_and_print(f"Status: {status_msg}", f)
-                write_to_file_and_print("-" * 60, f)
-        
-        if unmapped_operators:
-            section_header = "\nUNMAPPED OPERATORS"
-            write_to_file_and_print(section_header, f)
-            write_to_file_and_print("="*80, f)
-            write_to_file_and_print("The following operators have no product mapping:", f)
-            for i, operator in enumerate(unmapped_operators, 1):
-                write_to_file_and_print(f"  {i}. {operator}", f)
-            write_to_file_and_print("Status: No product mapping available - cannot search", f)
-        
-        section_header = "\nSUMMARY"
-        write_to_file_and_print(section_header, f)
-        write_to_file_and_print("="*80, f)
-        write_to_file_and_print(f"Query date: {today}", f)
-        write_to_file_and_print(f"Products with releases: {len(products_with_releases)}", f)
-        write_to_file_and_print(f"Products with no releases: {len(products_without_releases)}", f)
-        write_to_file_and_print(f"Unmapped operators: {len(unmapped_operators)}", f)
-        write_to_file_and_print(f"Total releases found: {sum(len(matches) for _, _, matches in products_with_releases)}", f)
-        write_to_file_and_print(f"Total products analyzed: {len(product_groups)}", f)
-        
-        write_to_file_and_print("\nOperator Answer Breakdown:", f)
-        write_to_file_and_print("-" * 40, f)
-        write_to_file_and_print(f"Operators with releases: {len(operators_with_answers)}", f)
-        write_to_file_and_print(f"Operators without releases: {len(operators_without_answers)}", f)
-        write_to_file_and_print(f"Total operators analyzed: {len(operators_with_answers) + len(operators_without_answers)}", f)
-        
-        write_to_file_and_print("\nProduct Operator Breakdown:", f)
-        write_to_file_and_print("-" * 40, f)
-        for product, operators in product_groups.items():
-            write_to_file_and_print(f"{product}: {len(operators)} operators", f)
-        
-        write_to_file_and_print("\n" + "="*80, f)
-        write_to_file_and_print("Report generated by OpenShift Day 2 Operator Search Tool - Conan", f)
-        if show_all:
-            write_to_file_and_print("Filter applied: All releases (past and future)", f)
+                values = releases[col]
+            columns.append(values.tolist())
+    return [RELEASE_BLOCK_TEMPLATE.format(*values) for values in zip(*columns)]
+
+def iter_product_results(df, product_groups, version_map, show_all=False, product_results=None,
+                         date_from=None, date_to=None, search_cache=None):
+    """Yield (product, operators, releases) per product group in source.txt order, searching each one when reached
+
+    product_results, if given, yields the (product, releases) of every group in that order instead.
+    """
+    if product_results is not None:
+        for product, releases in product_results:
+            yield product, [operator for operator, _ in product_groups[product]], releases
+        return
+    for product, operator_tuples in product_groups.items():
+        releases = find_product_releases(df, product, operator_tuples, version_map, show_all,
+                                         cache=search_cache, date_from=date_from, date_to=date_to)[1]
+        yield product, [operator for operator, _ in operator_tuples], releases
+
+def release_record(row):
+    """Machine-readable fields of one release row (pandas row or ReleaseRecord); missing values become None"""
+    record = OrderedDict()
+    for field, col in RELEASE_RECORD_FIELDS.items():
+        value = row.get(col)
+        if is_missing(value) or value == '':
+            value = None
+        elif col == 'GA date':
+            value = value.date()
+        record[field] = value
+    return record
+
+def product_record(product, operators, releases, top=2):
+    """Machine-readable result of one product group: its operators and its --top closest releases"""
+    found = len(releases)
+    closest = closest_releases(releases, top) if found else []
+    return OrderedDict([('product', product), ('operators', operators), ('found', found),
+                        ('releases', [release_record(row) for row in iter_release_rows(closest)])])
+
+def flat_release_rows(record):
+    """One row per release of a product record, or a single row without release fields if it has none"""
+    group = OrderedDict([('product', record['product']), ('operators', ', '.join(record['operators'])),
+                         ('found', record['found'])])
+    if not record['releases']:
+        return [OrderedDict(group, **{field: None for field in RELEASE_RECORD_FIELDS})]
+    return [OrderedDict(group, **release) for release in record['releases']]
+
+def json_default(value):
+    """Serialize the GA dates of release records as YYYY-MM-DD"""
+    if isinstance(value, date):
+        return value.strftime(GA_DATE_FORMAT)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def open_report_output(output_file, stream=None, binary=False):
+    """Context manager giving the file to write a report to, or stream itself for '-'"""
+    if output_file == STDOUT_OUTPUT:
+        stream = stream if stream is not None else sys.stdout
+        return contextlib.nullcontext(stream.buffer if binary else stream)
+    if binary:
+        return open(output_file, 'wb')
+    return open(output_file, 'w', encoding='utf-8', newline='')
+
+def export_results(operator_product_pairs, df, version_map, output_file, output_format, show_all=False,
+                   product_groups=None, product_results=None, date_from=None, date_to=None, top=2,
+                   report_stream=None):
+    """Write the per-product results as json, ndjson, csv or parquet records"""
+    if product_groups is None:
+        product_groups = group_operators_by_product(operator_product_pairs)
+    search_cache = None
+    if product_results is None:
+        search_cache = SearchCache(df, MultiPatternIndex(df, search_needles(product_groups)))
+    records = (product_record(product, operators, releases, top) for product, operators, releases in
+               iter_product_results(df, product_groups, version_map, show_all, product_results,
+                                    date_from, date_to, search_cache))
+    
+    exported = []
+    if output_format == 'ndjson':
+        # One line per product, flushed as soon as the product has been searched
+        with open_report_output(output_file, report_stream) as out:
+            for record in records:
+                out.write(json.dumps(record, ensure_ascii=False, default=json_default) + '\n')
+                out.flush()
+                exported.append(record['found'])
+    elif output_format == 'json':
+        start, stop = release_window(show_all, date_from, date_to)
+        document = OrderedDict([
+            ('generated', datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+            ('query_date', date.today()),
+            ('ga_date_from', start),
+            ('ga_date_to', stop - timedelta(days=1) if stop else None),
+            ('version_filters', version_map),
+            ('products', list(records)),
+            ('unmapped_operators', [item[0] for item in operator_product_pairs if not item[1]]),
+        ])
+        exported = [record['found'] for record in document['products']]
+        with open_report_output(output_file, report_stream) as out:
+            out.write(json.dumps(document, ensure_ascii=False, indent=2, default=json_default) + '\n')
+    else:
+        rows = []
+        for record in records:
+            rows.extend(flat_release_rows(record))
+            exported.append(record['found'])
+        columns = ['product', 'operators', 'found'] + list(RELEASE_RECORD_FIELDS)
+        if output_format == 'csv':
+            with open_report_output(output_file, report_stream) as out:
+                writer = csv.DictWriter(out, fieldnames=columns)
+                writer.writeheader()
+                writer.writerows(rows)
         else:
-            write_to_file_and_print(f"Filter applied: Only releases after {today}", f)
-        write_to_file_and_print("="*80, f)
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            types = {'GA date': pa.date32(), 'found': pa.int64()}
+            schema = pa.schema([(col, types.get(col, pa.string())) for col in columns])
+            table = pa.Table.from_pylist(rows, schema=schema)
+            with open_report_output(output_file, report_stream, binary=True) as out:
+                pq.write_table(table, out)
     
-    print(f"\nResults exported to: {output_file}")
+    if output_file != STDOUT_OUTPUT:
+        print(f"\nResults exported to: {output_file}")
+    print(f"Exported {len(exported)} product(s), {sum(1 for found in exported if found)} with releases "
+          f"({sum(exported)} release(s) found), as {output_format}")
+    if search_cache is not None:
+        print(f"Search cache: {search_cache.hits} hit(s), {search_cache.misses} miss(es) "
+              f"for {search_cache.hits + search_cache.misses} operator searches")
+
+def report_unmapped_operators(operator_product_pairs):
+    """Operators of source.txt that have no product mapping"""
+    unmapped_operators = []
+    for item in operator_product_pairs:
+        if len(item) == 3:
+            operator, product, release_name = item
+        else:
+            operator, product = item[0], item[1]
+        if not product:
+            unmapped_operators.append(operator)
+    return unmapped_operators
+
+def no_releases_status(show_all, window, today):
+    """Status line of a product without releases"""
+    if window:
+        return f"No releases found ({window})"
     if show_all:
+        return "No releases found"
+    return f"No future releases found (after {today})"
+
+def add_report_header(report, timestamp, today, show_all, window, version_map):
+    """Title, filters and heading at the top of the text report"""
+    header = f"OpenShift Day 2 Operator Search Results - Conan Tool"
+    report.add(header)
+    report.add(f"Generated: {timestamp}")
+    if window:
+        report.add(f"Filter: Only showing releases with GA dates {window}")
+    elif show_all:
+        report.add(f"Filter: Showing all releases (including past and future)")
+    else:
+        report.add(f"Filter: Only showing releases with GA dates after {today}")
+    if version_map:
+        filters = ', '.join(f"{product}: {' or '.join(versions)}" for product, versions in version_map.items())
+        report.add(f"Version Filter: {filters}")
+    report.add("="*80)
+    report.add("Search Results by Product/Release Mapping (Source.txt Order):")
+    report.add("="*80)
+
+def add_product_releases(report, i, product, operators, matches_first, top, show_all, window):
+    """Section of a product with releases: its operators and its --top closest releases"""
+    report.add(f"\nProduct {i}: {product}")
+    report.add(f"Operators: {', '.join(operators)}")
+    report.add("-" * 60)
+    
+    # Take only the --top releases with the closest GA dates
+    closest = closest_releases(matches_first, top)
+    
+    if show_all or window:
+        report.add(f"Found {len(matches_first)} release(s):")
+    else:
+        report.add(f"Found {len(matches_first)} future release(s):")
+    for block in format_release_blocks(closest):
+        report.add(block)
+
+def add_product_status(report, i, product, operators, status_msg):
+    """Section of a product without releases"""
+    report.add(f"\nProduct {i}: {product}")
+    report.add(f"Operators: {', '.join(operators)}")
+    report.add(f"Status: {status_msg}")
+    report.add("-" * 60)
+
+def add_unmapped_operators(report, unmapped_operators):
+    """Section listing the operators without a product mapping"""
+    section_header = "\nUNMAPPED OPERATORS"
+    report.add(section_header)
+    report.add("="*80)
+    report.add("The following operators have no product mapping:")
+    for i, operator in enumerate(unmapped_operators, 1):
+        report.add(f"  {i}. {operator}")
+    report.add("Status: No product mapping available - cannot search")
+
+def add_report_summary(report, today, show_all, window, product_groups, products_with_releases,
+                       products_without_releases, unmapped_operators, total_releases,
+                       operators_with_answers, operators_without_answers):
+    """Summary trailer of the text report with the totals of the run"""
+    section_header = "\nSUMMARY"
+    report.add(section_header)
+    report.add("="*80)
+    report.add(f"Query date: {today}")
+    report.add(f"Products with releases: {products_with_releases}")
+    report.add(f"Products with no releases: {products_without_releases}")
+    report.add(f"Unmapped operators: {len(unmapped_operators)}")
+    report.add(f"Total releases found: {total_releases}")
+    report.add(f"Total products analyzed: {len(product_groups)}")
+    
+    report.add("\nOperator Answer Breakdown:")
+    report.add("-" * 40)
+    report.add(f"Operators with releases: {operators_with_answers}")
+    report.add(f"Operators without releases: {operators_without_answers}")
+    report.add(f"Total operators analyzed: {operators_with_answers + operators_without_answers}")
+    
+    report.add("\nProduct Operator Breakdown:")
+    report.add("-" * 40)
+    for product, operators in product_groups.items():
+        report.add(f"{product}: {len(operators)} operators")
+    
+    report.add("\n" + "="*80)
+    report.add("Report generated by OpenShift Day 2 Operator Search Tool - Conan")
+    if window:
+        report.add(f"Filter applied: Only releases {window}")
+    elif show_all:
+        report.add("Filter applied: All releases (past and future)")
+    else:
+        report.add(f"Filter applied: Only releases after {today}")
+    report.add("="*80)
+
+def print_report_footer(output_file, today, show_all, window, search_cache):
+    """Console lines printed after the text report has been written"""
+    if output_file != STDOUT_OUTPUT:
+        print(f"\nResults exported to: {output_file}")
+    if window:
+        print(f"Showing only releases {window}")
+    elif show_all:
         print("Showing all releases (past and future)")
     else:
         print(f"Showing only releases after: {today}")
+    if search_cache is not None:
+        print(f"Search cache: {search_cache.hits} hit(s), {search_cache.misses} miss(es) "
+              f"for {search_cache.hits + search_cache.misses} operator searches")
+
+def format_results_by_product(operator_product_pairs, df, version_map, output_file='results.txt', show_all=False,
+                              product_groups=None, product_results=None, date_from=None, date_to=None, top=2,
+                              quiet=False, report_stream=None):
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    today = date.today()
+    window = describe_window(show_all, date_from, date_to)
+    
+    report = ReportBuilder()
+    add_report_header(report, timestamp, today, show_all, window, version_map)
+    
+    if product_groups is None:
+        product_groups = group_operators_by_product(operator_product_pairs)
+    search_cache = None
+    if product_results is None:
+        search_cache = SearchCache(df, MultiPatternIndex(df, search_needles(product_groups)))
+    product_results = OrderedDict(
+        (product, releases) for product, _, releases in
+        iter_product_results(df, product_groups, version_map, show_all, product_results, date_from, date_to,
+                             search_cache)
+    )
+    
+    # Track operators with and without answers
+    operators_with_answers = []
+    operators_without_answers = []
+    
+    products_with_releases = []
+    products_without_releases = []
+    
+    for product, operator_tuples in product_groups.items():
+        operators = [operator for operator, _ in operator_tuples]
+        future_matches = product_results[product]
+        
+        if len(future_matches):
+            products_with_releases.append((product, operators, future_matches))
+            operators_with_answers.extend(operators)
+        else:
+            products_without_releases.append((product, operators))
+            operators_without_answers.extend(operators)
+    
+    # Add unmapped operators to those without answers
+    unmapped_operators = report_unmapped_operators(operator_product_pairs)
+    operators_without_answers.extend(unmapped_operators)
+    
+    if products_with_releases:
+        if show_all or window:
+            section_header = "\nPRODUCTS WITH RELEASES FOUND"
+        else:
+            section_header = "\nPRODUCTS WITH FUTURE RELEASES FOUND"
+        report.add(section_header)
+        report.add("="*80)
+        
+        for i, (product, operators, matches_first) in enumerate(products_with_releases, 1):
+            add_product_releases(report, i, product, operators, matches_first, top, show_all, window)
+    
+    if products_without_releases:
+        if show_all or window:
+            section_header = "\nPRODUCTS WITH NO RELEASES"
+        else:
+            section_header = "\nPRODUCTS WITH NO FUTURE RELEASES"
+        report.add(section_header)
+        report.add("="*80)
+        
+        status_msg = no_releases_status(show_all, window, today)
+        for i, (product, operators) in enumerate(products_without_releases, 1):
+            add_product_status(report, i, product, operators, status_msg)
+    
+    if unmapped_operators:
+        add_unmapped_operators(report, unmapped_operators)
+    
+    add_report_summary(report, today, show_all, window, product_groups, len(products_with_releases),
+                       len(products_without_releases), unmapped_operators,
+                       sum(len(matches) for _, _, matches in products_with_releases),
+                       len(operators_with_answers), len(operators_without_answers))
+    report.write(output_file, echo=not quiet, stream=report_stream)
+    print_report_footer(output_file, today, show_all, window, search_cache)
+
+def stream_results_by_product(operator_product_pairs, df, version_map, output_file='results.txt', show_all=False,
+                              product_groups=None, product_results=None, date_from=None, date_to=None, top=2,
+                              quiet=False, report_stream=None):
+    """Text report written product by product in source.txt order, each as soon as it has been searched"""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    today = date.today()
+    window = describe_window(show_all, date_from, date_to)
+    if report_stream is None:
+        report_stream = sys.stdout
+    
+    if product_groups is None:
+        product_groups = group_operators_by_product(operator_product_pairs)
+    search_cache = None
+    if product_results is None:
+        search_cache = SearchCache(df, SearchIndex(df))
+    
+    with contextlib.ExitStack() as stack:
+        destinations = []
+        if output_file != STDOUT_OUTPUT:
+            destinations.append(stack.enter_context(open(output_file, 'w', encoding='utf-8')))
+        if output_file == STDOUT_OUTPUT or not quiet:
+            destinations.append(report_stream)
+        
+        report = ReportBuilder()
+        add_report_header(report, timestamp, today, show_all, window, version_map)
+        report.drain(destinations)
+        
+        products_with_releases = 0
+        operators_with_answers = 0
+        operators_without_answers = 0
+        total_releases = 0
+        status_msg = no_releases_status(show_all, window, today)
+        for i, (product, operators, releases) in enumerate(
+                iter_product_results(df, product_groups, version_map, show_all, product_results,
+                                     date_from, date_to, search_cache), 1):
+            if len(releases):
+                add_product_releases(report, i, product, operators, releases, top, show_all, window)
+                products_with_releases += 1
+                operators_with_answers += len(operators)
+                total_releases += len(releases)
+            else:
+                add_product_status(report, i, product, operators, status_msg)
+                operators_without_answers += len(operators)
+            report.drain(destinations)
+        
+        unmapped_operators = report_unmapped_operators(operator_product_pairs)
+        if unmapped_operators:
+            add_unmapped_operators(report, unmapped_operators)
+        add_report_summary(report, today, show_all, window, product_groups, products_with_releases,
+                           len(product_groups) - products_with_releases, unmapped_operators, total_releases,
+                           operators_with_answers, operators_without_answers + len(unmapped_operators))
+        report.drain(destinations)
+    print_report_footer(output_file, today, show_all, window, search_cache)
 
 def main():
-    args = parse_arguments()
+    if len(sys.argv) > 1 and sys.argv[1] == 'import':
+        import_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'diff':
+        diff_main(sys.argv[2:])
+        return
     
+    args = parse_arguments()
+    if args.output_file == STDOUT_OUTPUT:
+        # Progress messages go to stderr, leaving stdout to the report
+        report_stream = sys.stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            search_main(args, report_stream)
+    else:
+        search_main(args)
+
+def search_main(args, report_stream=None):
+    """Run the search and write the report for parsed command-line arguments"""
     print("Operator to Product/Release Search Tool")
     print("Processing in source.txt file order")
-    if args.show_all:
+    window = describe_window(args.show_all, args.date_from, args.date_to)
+    if window:
+        print(f"Filter: Only showing releases {window}")
+    elif args.show_all:
         print("Filter: Showing all releases (past and future)")
     else:
         print(f"Filter: Only showing future releases (after {date.today()})")
     print("="*60)
     
-    df = load_csv_data(args.csv_file)
-    if df is None:
-        return
+    csv_file = args.csv_file
+    if not csv_file and not (args.export_dir or args.backend == 'sqlite'):
+        csv_file = find_csv_file(args.export_order)
+    engine = choose_csv_engine(csv_file, args)
+    
+    records = None
+    if engine == 'python':
+        print(f"Loading: {csv_file} (python engine)")
+        records = load_csv_records(csv_file)
+        if records is None:
+            engine = 'pandas'
+    
+    if records is not None:
+        df = None
+    elif args.backend == 'sqlite':
+        df = None
+        conn = load_release_db(args.db_file)
+        if conn is None:
+            return
+    elif args.stream:
+        # The search items are needed up front to decide which rows to keep
+        operator_product_pairs = load_search_items(args.source_file)
+        if not operator_product_pairs:
+            return
+        df = stream_csv_data(csv_file, operator_product_pairs)
+        if df is None:
+            return
+    elif args.export_dir:
+        df = load_export_dir(args.export_dir, use_cache=not args.no_cache, engine=engine,
+                             order=args.export_order)
+        if df is None:
+            return
+    else:
+        df = load_csv_data(csv_file, use_cache=not args.no_cache, engine=engine, order=args.export_order)
+        if df is None:
+            return
     
     version_map = {}
     if not args.no_version_filter:
-        version_map = load_reference_versions(args.reference_file)
+        version_map = load_reference_versions(args.reference_file, load_product_aliases(args.aliases_file))
     
-    operator_product_pairs = load_search_items(args.source_file)
-    if not operator_product_pairs:
-        return
+    if not args.stream:
+        operator_product_pairs = load_search_items(args.source_file)
+        if not operator_product_pairs:
+            return
     
-    format_results_by_product(operator_product_pairs, df, version_map, args.output_file, args.show_all)
+    product_groups = group_operators_by_product(operator_product_pairs)
+    # Every engine but join yields each product's results as it is searched, so streamed output starts at once
+    product_results = None
+    if records is not None:
+        product_results = iter_python_product_results(records, product_groups, version_map, args.show_all,
+                                                      args.date_from, args.date_to)
+    elif args.backend == 'sqlite':
+        product_results = iter_sqlite_product_results(conn, product_groups, version_map, args.show_all,
+                                                      args.date_from, args.date_to)
+    elif args.backend == 'join':
+        product_results = join_product_results(df, product_groups, version_map, args.show_all,
+                                               args.date_from, args.date_to).items()
+    elif args.delta:
+        product_results = iter_product_results_delta(df, product_groups, version_map, args.show_all, args.delta,
+                                                     engine, args.date_from, args.date_to)
+    
+    if args.output_format != 'text':
+        export_results(operator_product_pairs, df, version_map, args.output_file, args.output_format, args.show_all,
+                       product_groups, product_results, args.date_from, args.date_to, args.top, report_stream)
+    else:
+        write_report = stream_results_by_product if args.stream_results else format_results_by_product
+        write_report(operator_product_pairs, df, version_map, args.output_file, args.show_all,
+                     product_groups, product_results, args.date_from, args.date_to, args.top,
+                     args.quiet, report_stream)
+    if args.backend == 'sqlite':
+        conn.close()
 
 if __name__ == "__main__":
     main()